@@ -1,15 +1,21 @@
 """Core analysis functions."""
 
+import contextlib
+import itertools
+import math
+import multiprocessing.util
 import os
 import warnings
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
+from typing import Any
 
-from aivid.extractors import get_available_extractors
+from aivid.extractors import BaseExtractor, ExifToolDaemon, get_available_extractors
 from aivid.models import FileInfo, VideoMetadata
 from aivid.utils.container import (
     MP4_EXTENSIONS,
-    extract_strings,
-    filter_interesting_strings,
+    filter_interesting_lines,
+    iter_string_lines,
     parse_mp4_boxes,
 )
 
@@ -46,6 +52,38 @@ def get_file_info(path: str) -> FileInfo:
     )
 
 
+def _prefetch(
+    executor: Executor, extractors: list[BaseExtractor], path: str, metadata: VideoMetadata
+) -> None:
+    """Run extractor prefetch hooks concurrently and wait for them.
+
+    External tools (ffprobe, exiftool, c2patool) spend nearly all their time
+    in process startup and file I/O, so running them in parallel makes the
+    wall time roughly that of the slowest tool instead of the sum.
+
+    Args:
+        executor: Thread pool to run the hooks on
+        extractors: Extractors that will run on the file
+        path: Path to the video file
+        metadata: Metadata object the extractors will populate
+    """
+    futures = [executor.submit(extractor.prefetch, path, metadata) for extractor in extractors]
+    for future in futures:
+        # Failures surface again (and are reported) when extract() refetches
+        future.exception()
+
+
+def _interesting_strings(path: str) -> list[str]:
+    """Extract strings from a file and keep the metadata-relevant ones.
+
+    Stops the ``strings`` scan as soon as enough matches have been found,
+    and only decodes the strings that are kept. If ``strings`` fails or
+    times out before then, the error propagates and nothing is kept.
+    """
+    with contextlib.closing(iter_string_lines(path)) as lines:
+        return filter_interesting_lines(lines)
+
+
 def analyze_file(path: str, full: bool = False) -> VideoMetadata:
     """Analyze a video file and extract all available metadata.
 
@@ -75,49 +113,146 @@ def analyze_file(path: str, full: bool = False) -> VideoMetadata:
     # Create metadata object
     metadata = VideoMetadata(file_info=file_info)
 
-    # Run all available extractors
-    for extractor in get_available_extractors():
-        try:
-            extractor.extract(path, metadata)
-        except Exception as e:
-            warnings.warn(f"{extractor.name} extraction failed: {e}", stacklevel=2)
+    extractors = get_available_extractors()
+    with ThreadPoolExecutor(max_workers=len(extractors) + 2) as executor:
+        # Box parsing (MP4/MOV) and string extraction (full mode) don't depend
+        # on the extractors, so they run alongside them
+        boxes_future = (
+            executor.submit(parse_mp4_boxes, path)
+            if file_info.extension in MP4_EXTENSIONS
+            else None
+        )
+        strings_future = executor.submit(_interesting_strings, path) if full else None
 
-    # Parse MP4 box structure for MP4/MOV files
-    if file_info.extension in MP4_EXTENSIONS:
-        try:
-            boxes = parse_mp4_boxes(path)
-            metadata.raw.box_structure = boxes
-        except Exception:
-            pass
+        # Fetch external tool output in parallel, then run extractors in priority order
+        _prefetch(executor, extractors, path, metadata)
+        for extractor in extractors:
+            try:
+                extractor.extract(path, metadata)
+            except Exception as e:
+                warnings.warn(f"{extractor.name} extraction failed: {e}", stacklevel=2)
 
-    # Extract interesting strings (for full mode)
-    if full:
-        try:
-            raw_strings = extract_strings(path)
-            metadata.raw.strings = filter_interesting_strings(raw_strings)
-        except Exception:
-            pass
+        if boxes_future is not None:
+            with contextlib.suppress(Exception):
+                metadata.raw.box_structure = boxes_future.result()
+
+        if strings_future is not None:
+            with contextlib.suppress(Exception):
+                metadata.raw.strings = strings_future.result()
 
     return metadata
 
 
-def analyze_files(paths: list[str], full: bool = False) -> list[VideoMetadata]:
+def _analyze_or_error(path: str, full: bool) -> tuple[VideoMetadata | None, str | None]:
+    """Analyze one file, returning the error message instead of raising.
+
+    Module-level so it can be sent to worker processes; the caller reports
+    errors from the main process.
+    """
+    try:
+        return analyze_file(path, full=full), None
+    except Exception as e:
+        return None, f"Failed to analyze {path}: {e}"
+
+
+def _init_worker(batch_states: list[tuple[type[BaseExtractor], Any]]) -> None:
+    """Prepare a pool worker process for analysis.
+
+    Runs as the ProcessPoolExecutor initializer. It loads the platform API
+    results that the parent looked up with ``prefetch_batch``. Workers do not
+    inherit them under the spawn and forkserver start methods. It then starts
+    a persistent exiftool process, which is shut down when the worker exits.
+    """
+    for extractor_cls, state in batch_states:
+        extractor_cls.restore_batch(state)
+    inherited = ExifToolDaemon.active()
+    if inherited is not None:
+        # Under fork the parent's daemon is inherited; its pipes must stay the
+        # parent's, so forget it without closing it
+        inherited._process = None
+        ExifToolDaemon._active = None
+    daemon = ExifToolDaemon().__enter__()
+    multiprocessing.util.Finalize(None, daemon.close, exitpriority=10)
+
+
+def analyze_files(
+    paths: list[str],
+    full: bool = False,
+    max_workers: int | None = None,
+    use_processes: bool = False,
+) -> list[VideoMetadata]:
     """Analyze multiple video files.
 
+    Files are analyzed concurrently on a thread pool (extraction is dominated
+    by external tool processes and file I/O), and a single persistent
+    exiftool process is shared across all files. Platform API lookups
+    (YouTube, TikTok) are batched across files. Results keep input order.
+
+    With ``use_processes=True`` files are spread over worker processes
+    instead, so JSON decoding and parsing also run in parallel on multi-core
+    hosts. Each worker process keeps its own persistent exiftool process and
+    receives the batched API results from the parent.
+
     Args:
         paths: List of file paths
         full: If True, extract all available metadata
+        max_workers: Maximum files in flight (default: 1.5x CPU count for
+            threads, CPU count for processes)
+        use_processes: Use a process pool instead of a thread pool
 
     Returns:
         List of VideoMetadata objects
+
+    Raises:
+        ValueError: If ``max_workers`` is less than 1
     """
-    results = []
-    for path in paths:
+    if max_workers is not None and max_workers < 1:
+        raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+
+    # Let batch-capable extractors (platform APIs) look up all files up front
+    extractor_classes = [type(extractor) for extractor in get_available_extractors()]
+    for extractor_cls in extractor_classes:
         try:
-            metadata = analyze_file(path, full=full)
-            results.append(metadata)
+            extractor_cls.prefetch_batch(paths)
         except Exception as e:
-            warnings.warn(f"Failed to analyze {path}: {e}", stacklevel=2)
+            warnings.warn(f"{extractor_cls.name} batch lookup failed: {e}", stacklevel=2)
+
+    results = []
+    try:
+        cpu_count = os.cpu_count() or 1
+        batch: contextlib.AbstractContextManager[object]
+        executor: Executor
+        if use_processes:
+            # Workers don't see the parent's class attributes under spawn/forkserver
+            batch_states = []
+            for extractor_cls in extractor_classes:
+                state = extractor_cls.batch_state()
+                if state is not None:
+                    batch_states.append((extractor_cls, state))
+            batch = contextlib.nullcontext()
+            executor = ProcessPoolExecutor(
+                max_workers=max_workers if max_workers is not None else cpu_count,
+                initializer=_init_worker,
+                initargs=(batch_states,),
+            )
+        else:
+            batch = ExifToolDaemon()
+            executor = ThreadPoolExecutor(
+                max_workers=max_workers if max_workers is not None else math.ceil(cpu_count * 1.5)
+            )
+
+        with batch, executor:
+            chunksize = 8 if use_processes else 1
+            for metadata, error in executor.map(
+                _analyze_or_error, paths, itertools.repeat(full), chunksize=chunksize
+            ):
+                if error:
+                    warnings.warn(error, stacklevel=2)
+                elif metadata is not None:
+                    results.append(metadata)
+    finally:
+        for extractor_cls in extractor_classes:
+            extractor_cls.release_batch()
     return results
 
 
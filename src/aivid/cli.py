@@ -14,22 +14,24 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import contextlib
 import os
 import sys
 
 from aivid._version import __version__
 from aivid.analyze import analyze_file
 from aivid.extractors import (
+    ExifToolDaemon,
     check_c2patool_available,
     get_extractor_status,
     sign_with_c2pa,
 )
 from aivid.formatters import (
     format_c2pa,
-    format_default,
-    format_full,
     format_json_list,
     format_quiet,
+    write_default,
+    write_full,
 )
 
 
@@ -206,33 +208,40 @@ Examples:
     all_metadata = []
     errors = 0
 
-    for file_path in args.files:
-        try:
-            print(f"Analyzing: {file_path}")
-            metadata = analyze_file(file_path, full=args.full)
-            all_metadata.append(metadata)
-
-            if args.quiet:
-                # Quick summary
-                print(format_quiet(metadata))
-            elif args.c2pa:
-                # C2PA mode
-                print(format_c2pa(metadata))
-            elif args.full:
-                # Full mode
-                print(format_full(metadata))
-            else:
-                # Default mode
-                print(format_default(metadata))
-
-            print()
-
-        except FileNotFoundError as e:
-            print(f"Error: {e}", file=sys.stderr)
-            errors += 1
-        except Exception as e:
-            print(f"Error analyzing {file_path}: {e}", file=sys.stderr)
-            errors += 1
+    # Share one exiftool process across files when analyzing a batch
+    batch: contextlib.AbstractContextManager[object] = (
+        ExifToolDaemon() if len(args.files) > 1 else contextlib.nullcontext()
+    )
+    with batch:
+        for file_path in args.files:
+            try:
+                print(f"Analyzing: {file_path}")
+                metadata = analyze_file(file_path, full=args.full)
+                all_metadata.append(metadata)
+
+                if args.quiet:
+                    # Quick summary
+                    print(format_quiet(metadata))
+                elif args.c2pa:
+                    # C2PA mode
+                    print(format_c2pa(metadata))
+                elif args.full:
+                    # Full mode (streamed, reports can be large)
+                    write_full(metadata, sys.stdout.write)
+                    print()
+                else:
+                    # Default mode
+                    write_default(metadata, sys.stdout.write)
+                    print()
+
+                print()
+
+            except FileNotFoundError as e:
+                print(f"Error: {e}", file=sys.stderr)
+                errors += 1
+            except Exception as e:
+                print(f"Error analyzing {file_path}: {e}", file=sys.stderr)
+                errors += 1
 
     # JSON export
     if args.output and all_metadata:
@@ -293,9 +302,11 @@ def analyze_url(args: argparse.Namespace) -> int:
         elif args.c2pa:
             print(format_c2pa(metadata))
         elif args.full:
-            print(format_full(metadata))
+            write_full(metadata, sys.stdout.write)
+            print()
         else:
-            print(format_default(metadata))
+            write_default(metadata, sys.stdout.write)
+            print()
 
         # Show source info
         print("\n## SOURCE INFO")
@@ -15,6 +15,10 @@ Example config file (~/.aivid/config.yaml):
       keep_downloads: false
     detection:
       enable_watermark: true
+    extraction:
+      keep_raw_blobs: false
+      cache_enabled: false
+      cache_dir: "~/.cache/aivid"
 """
 
 from __future__ import annotations
@@ -60,6 +64,15 @@ class DetectionConfig:
     videoseal_threshold: float = 0.5
 
 
+@dataclass
+class ExtractionConfig:
+    """Metadata extraction configuration."""
+
+    keep_raw_blobs: bool = False
+    cache_enabled: bool = False
+    cache_dir: str | None = None
+
+
 @dataclass
 class AividConfig:
     """Main configuration for aivid."""
@@ -67,6 +80,7 @@ class AividConfig:
     api_keys: APIKeysConfig = field(default_factory=APIKeysConfig)
     download: DownloadConfig = field(default_factory=DownloadConfig)
     detection: DetectionConfig = field(default_factory=DetectionConfig)
+    extraction: ExtractionConfig = field(default_factory=ExtractionConfig)
 
 
 def _load_yaml_config() -> dict[str, Any]:
@@ -150,10 +164,21 @@ def load_config() -> AividConfig:
         ),
     )
 
+    # Extraction config
+    extraction_config = file_config.get("extraction", {})
+    extraction = ExtractionConfig(
+        keep_raw_blobs=_parse_bool(_get_env("KEEP_RAW_BLOBS"))
+        or bool(extraction_config.get("keep_raw_blobs", False)),
+        cache_enabled=_parse_bool(_get_env("CACHE"))
+        or bool(extraction_config.get("cache_enabled", False)),
+        cache_dir=_get_env("CACHE_DIR") or extraction_config.get("cache_dir"),
+    )
+
     return AividConfig(
         api_keys=api_keys,
         download=download,
         detection=detection,
+        extraction=extraction,
     )
 
 
@@ -6,7 +6,7 @@ from aivid.extractors.c2patool import (
     check_c2patool_available,
     sign_with_c2pa,
 )
-from aivid.extractors.exiftool import ExifToolExtractor
+from aivid.extractors.exiftool import ExifToolDaemon, ExifToolExtractor
 from aivid.extractors.ffprobe import FFprobeExtractor
 from aivid.extractors.heuristic import HeuristicDetector
 from aivid.extractors.tiktok_api import TikTokAPIExtractor
@@ -101,6 +101,8 @@ __all__ = [
     "HeuristicDetector",
     "YouTubeAPIExtractor",
     "TikTokAPIExtractor",
+    # Batch helpers
+    "ExifToolDaemon",
     # Functions
     "get_available_extractors",
     "get_extractor_status",
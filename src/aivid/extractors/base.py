@@ -1,10 +1,13 @@
 """Base extractor class."""
 
 from abc import ABC, abstractmethod
-from typing import ClassVar
+from collections.abc import Callable
+from typing import Any, ClassVar, TypeVar
 
 from aivid.models import VideoMetadata
 
+T = TypeVar("T")
+
 
 class BaseExtractor(ABC):
     """Abstract base class for metadata extractors.
@@ -22,6 +25,10 @@ class BaseExtractor(ABC):
     name: ClassVar[str] = "base"
     priority: ClassVar[int] = 100
 
+    def __init__(self) -> None:
+        # Results of prefetch(), keyed by file path
+        self._prefetched: dict[str, Any] = {}
+
     @classmethod
     @abstractmethod
     def is_available(cls) -> bool:
@@ -42,5 +49,76 @@ class BaseExtractor(ABC):
         """
         pass
 
+    def prefetch(self, path: str, metadata: VideoMetadata) -> None:
+        """Fetch slow external data for a file ahead of :meth:`extract`.
+
+        ``analyze_file`` calls this for all extractors concurrently before
+        running :meth:`extract` in priority order, so extractors that shell
+        out to external tools can overlap their I/O. The default does nothing.
+
+        Args:
+            path: Path to the video file
+            metadata: The object :meth:`extract` will populate. Read it to make
+                the same decisions (e.g. which video ID to look up), but do not
+                modify it here.
+        """
+        return None
+
+    @classmethod
+    def prefetch_batch(cls, paths: list[str]) -> None:
+        """Fetch data for many files at once, ahead of per-file analysis.
+
+        ``analyze_files`` calls this once per extractor class before analyzing
+        any file, so extractors backed by batch-capable APIs can replace one
+        request per file with a few bulk requests. The default does nothing.
+
+        Args:
+            paths: Paths to the video files
+        """
+        return None
+
+    @classmethod
+    def release_batch(cls) -> None:
+        """Drop data stored by :meth:`prefetch_batch`. The default does nothing."""
+        return None
+
+    @classmethod
+    def batch_state(cls) -> Any:
+        """Return data stored by :meth:`prefetch_batch` so it can be sent elsewhere.
+
+        With ``use_processes=True``, ``analyze_files`` passes this to every
+        worker process through :meth:`restore_batch`. Under the spawn and
+        forkserver start methods, workers do not share class attributes with
+        the parent. The default returns None (nothing to send).
+
+        Returns:
+            Picklable batch data, or None
+        """
+        return None
+
+    @classmethod
+    def restore_batch(cls, state: Any) -> None:
+        """Load data returned by :meth:`batch_state`. The default does nothing.
+
+        Args:
+            state: Value returned by :meth:`batch_state` in the parent process
+        """
+        return None
+
+    def _take_prefetched(self, path: str, fetch: Callable[[str], T]) -> T:
+        """Return prefetched data for a file, fetching it now if absent.
+
+        Args:
+            path: Path to the video file
+            fetch: Function that produces the data for ``path``
+
+        Returns:
+            The prefetched result, or ``fetch(path)`` if nothing was prefetched
+        """
+        if path in self._prefetched:
+            result: T = self._prefetched.pop(path)
+            return result
+        return fetch(path)
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(name={self.name!r}, priority={self.priority})"
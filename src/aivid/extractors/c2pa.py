@@ -1,14 +1,26 @@
 """C2PA metadata extractor using c2pa-python library."""
 
 import contextlib
-import json
 import re
-from datetime import datetime
 from typing import Any, ClassVar
 
+from aivid.config import get_config
 from aivid.extractors.base import BaseExtractor
 from aivid.models import C2PAAction, VideoMetadata
-from aivid.models.ai import AI_GENERATORS, SIGNING_AUTHORITIES
+from aivid.models.ai import SIGNING_AUTHORITIES_LOWER, match_ai_generator
+from aivid.utils import fastjson
+from aivid.utils.dates import parse_iso_datetime
+from aivid.utils.manifest import (
+    IMAGE_FORMAT_HINTS,
+    VIDEO_FORMAT_HINTS,
+    first_key,
+    strip_binary_blobs,
+)
+
+try:
+    from c2pa import Reader as _Reader
+except ImportError:
+    _Reader = None
 
 # Pattern to extract task_id from Sora title format: {task_id}_media.mp4
 TASK_ID_PATTERN = re.compile(r"^([a-f0-9]{32})_media\.(mp4|webm|mov)$", re.IGNORECASE)
@@ -29,21 +41,17 @@ class C2PAExtractor(BaseExtractor):
     @classmethod
     def is_available(cls) -> bool:
         """Check if c2pa-python is available."""
-        try:
-            from c2pa import Reader  # noqa: F401
-
-            return True
-        except ImportError:
-            return False
+        return _Reader is not None
 
     def extract(self, path: str, metadata: VideoMetadata) -> None:
         """Extract C2PA metadata using c2pa-python."""
-        try:
-            from c2pa import Reader
+        if _Reader is None:
+            return
 
-            with Reader(path) as reader:
+        try:
+            with _Reader(path) as reader:
                 manifest_json = reader.json()
-                manifest_data = json.loads(manifest_json)
+                manifest_data = fastjson.loads(manifest_json)
                 self._parse_manifest(manifest_data, metadata)
         except Exception:
             # No C2PA data or parsing error
@@ -55,7 +63,9 @@ class C2PAExtractor(BaseExtractor):
         c2pa.has_c2pa = True
         c2pa.source = "c2pa-python"
 
-        # Store raw manifest
+        # Store raw manifest, dropping embedded thumbnails unless asked to keep them
+        if not get_config().extraction.keep_raw_blobs:
+            data = strip_binary_blobs(data)
         metadata.raw.c2pa = data
 
         # Get active manifest
@@ -76,7 +86,7 @@ class C2PAExtractor(BaseExtractor):
         c2pa.format = manifest.get("format")
 
         # Instance ID (XMP instance identifier)
-        c2pa.instance_id = manifest.get("instanceId") or manifest.get("instance_id")
+        c2pa.instance_id = first_key(manifest, "instanceId", "instance_id")
 
         # Extract task_id from title (e.g., "b1f75fc641144ddba74f8392297bc898_media.mp4")
         if c2pa.title:
@@ -115,7 +125,7 @@ class C2PAExtractor(BaseExtractor):
             if time_str:
                 with contextlib.suppress(ValueError, TypeError):
                     # Handle ISO format with timezone
-                    c2pa.signature_time = datetime.fromisoformat(time_str.replace("Z", "+00:00"))
+                    c2pa.signature_time = parse_iso_datetime(time_str)
 
         # Parse assertions
         assertions = manifest.get("assertions", [])
@@ -137,24 +147,29 @@ class C2PAExtractor(BaseExtractor):
 
         validation_status = data.get("validation_status", [])
         if validation_status:
-            c2pa.validation_errors = [
-                status.get("explanation", "") for status in validation_status if status
-            ]
-            # Check for untrusted certificate in validation status
+            # Collect errors and check for untrusted certificates in one pass
+            errors = []
+            has_untrusted = False
             for status in validation_status:
-                if status and "untrusted" in str(status.get("code", "")).lower():
-                    c2pa.cert_trusted = False
-                    break
+                if not status:
+                    continue
+                errors.append(status.get("explanation", ""))
+                if not has_untrusted:
+                    code = str(status.get("code", "")).lower()
+                    has_untrusted = "untrusted" in code
+            c2pa.validation_errors = errors
+            if has_untrusted:
+                c2pa.cert_trusted = False
             # If no trust issues found and not already set, mark as trusted
-            if c2pa.cert_trusted is None and c2pa.validation_state == "Valid":
+            elif c2pa.cert_trusted is None and c2pa.validation_state == "Valid":
                 c2pa.cert_trusted = True
 
         # Extract timestamp authority info from signature_info
         if sig_info:
-            tsa_info = sig_info.get("time_authority", {}) or sig_info.get("tsa", {})
+            tsa_info = first_key(sig_info, "time_authority", "tsa")
             if tsa_info:
                 c2pa.timestamp_validated = True
-                c2pa.timestamp_responder = tsa_info.get("responder") or tsa_info.get("name")
+                c2pa.timestamp_responder = first_key(tsa_info, "responder", "name")
             elif c2pa.signature_time:
                 # Has signature time but unknown if TSA validated
                 c2pa.timestamp_validated = None
@@ -197,19 +212,13 @@ class C2PAExtractor(BaseExtractor):
             has_image = False
             has_video = False
             for ingredient in c2pa.ingredients:
-                # Check format or relationship type
                 ing_format = ingredient.get("format", "").lower()
-                relationship = ingredient.get("relationship", "").lower()
-
-                if any(x in ing_format for x in ["image", "jpeg", "jpg", "png", "webp"]):
-                    has_image = True
-                if any(x in ing_format for x in ["video", "mp4", "webm", "mov"]):
+                if any(x in ing_format for x in VIDEO_FORMAT_HINTS):
+                    # A video ingredient decides the mode, no need to look further
                     has_video = True
-
-                # Also check relationship field
-                if "parentOf" in relationship or "inputTo" in relationship:
-                    # This is a source ingredient
-                    pass
+                    break
+                if not has_image:
+                    has_image = any(x in ing_format for x in IMAGE_FORMAT_HINTS)
 
             if has_video:
                 c2pa.generation_mode = "video2video"
@@ -239,8 +248,7 @@ class C2PAExtractor(BaseExtractor):
             source_type = action.get("digitalSourceType", "")
             if source_type:
                 # Extract just the type name from URL if present
-                if "/" in source_type:
-                    source_type = source_type.split("/")[-1]
+                source_type = source_type[source_type.rfind("/") + 1 :]
                 c2pa.digital_source_type = source_type
 
             # Parse when timestamp
@@ -248,7 +256,7 @@ class C2PAExtractor(BaseExtractor):
             when_str = action.get("when")
             if when_str:
                 with contextlib.suppress(ValueError, TypeError):
-                    when_time = datetime.fromisoformat(str(when_str).replace("Z", "+00:00"))
+                    when_time = parse_iso_datetime(when_str)
 
             # Create action record
             c2pa_action = C2PAAction(
@@ -289,14 +297,14 @@ class C2PAExtractor(BaseExtractor):
         generator_name = c2pa.claim_generator or c2pa.software_agent
         if generator_name:
             ai.generator_raw = generator_name
-            for key, value in AI_GENERATORS.items():
-                if key.lower() in generator_name.lower():
-                    ai.generator = value
-                    ai.is_ai_generated = True
-                    break
+            generator = match_ai_generator(generator_name)
+            if generator:
+                ai.generator = generator
+                ai.is_ai_generated = True
 
         # Identify signing authorities
         if c2pa.issuer:
-            for auth in SIGNING_AUTHORITIES:
-                if auth.lower() in c2pa.issuer.lower() and auth not in ai.signing_authorities:
+            issuer_lower = c2pa.issuer.lower()
+            for auth_lower, auth in SIGNING_AUTHORITIES_LOWER:
+                if auth_lower in issuer_lower and auth not in ai.signing_authorities:
                     ai.signing_authorities.append(auth)
@@ -1,16 +1,26 @@
 """C2PA metadata extractor using c2patool CLI (fallback)."""
 
 import contextlib
-import json
 import re
-import shutil
 import subprocess
-from datetime import datetime
 from typing import Any, ClassVar
 
+from aivid.config import get_config
 from aivid.extractors.base import BaseExtractor
+from aivid.extractors.c2pa import C2PAExtractor
+from aivid.extractors.cache import cached_tool_output
 from aivid.models import C2PAAction, VideoMetadata
-from aivid.models.ai import AI_GENERATORS, SIGNING_AUTHORITIES, infer_sora_model
+from aivid.models.ai import SIGNING_AUTHORITIES_LOWER, infer_sora_model, match_ai_generator
+from aivid.utils import fastjson
+from aivid.utils.dates import parse_iso_datetime
+from aivid.utils.deps import has_executable
+from aivid.utils.manifest import (
+    IMAGE_FORMAT_HINTS,
+    VIDEO_FORMAT_HINTS,
+    first_key,
+    strip_binary_blobs,
+)
+from aivid.utils.process import run_tool
 
 # Pattern to extract task_id from Sora title format: {task_id}_media.mp4
 TASK_ID_PATTERN = re.compile(r"^([a-f0-9]{32})_media\.(mp4|webm|mov)$", re.IGNORECASE)
@@ -32,22 +42,40 @@ class C2PAToolExtractor(BaseExtractor):
     @classmethod
     def is_available(cls) -> bool:
         """Check if c2patool CLI is available."""
-        return shutil.which("c2patool") is not None
+        return has_executable("c2patool")
+
+    def prefetch(self, path: str, metadata: VideoMetadata) -> None:
+        """Run c2patool ahead of extraction unless c2pa-python will handle the file."""
+        if not C2PAExtractor.is_available():
+            self._prefetched[path] = self._fetch(path)
 
     def extract(self, path: str, metadata: VideoMetadata) -> None:
         """Extract C2PA metadata using c2patool CLI."""
+        c2pa = metadata.provenance.c2pa
+
+        # Skip if c2pa-python already extracted
+        if c2pa.has_c2pa and c2pa.source == "c2pa-python":
+            self._prefetched.pop(path, None)
+            return
+
+        manifest_data = self._take_prefetched(path, self._fetch)
+        if manifest_data is not None:
+            self._parse_manifest(manifest_data, metadata)
+
+    def _fetch(self, path: str) -> dict[str, Any] | None:
+        """Return c2patool output, from the disk cache when enabled."""
+        return cached_tool_output(self.name, path, self._run_c2patool)
+
+    def _run_c2patool(self, path: str) -> dict[str, Any] | None:
+        """Run c2patool and return the parsed manifest store, or None."""
         try:
-            result = subprocess.run(
-                ["c2patool", path],
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
+            result = run_tool(["c2patool", path], timeout=30)
             if result.returncode == 0 and result.stdout:
-                manifest_data = json.loads(result.stdout)
-                self._parse_manifest(manifest_data, metadata)
-        except (subprocess.TimeoutExpired, json.JSONDecodeError, FileNotFoundError):
+                manifest_data: dict[str, Any] = fastjson.loads(result.stdout)
+                return manifest_data
+        except (subprocess.TimeoutExpired, fastjson.JSONDecodeError, FileNotFoundError):
             pass
+        return None
 
     def _parse_manifest(self, data: dict[str, Any], metadata: VideoMetadata) -> None:
         """Parse C2PA manifest data from c2patool output."""
@@ -60,7 +88,9 @@ class C2PAToolExtractor(BaseExtractor):
         c2pa.has_c2pa = True
         c2pa.source = "c2patool"
 
-        # Store raw manifest
+        # Store raw manifest, dropping embedded thumbnails unless asked to keep them
+        if not get_config().extraction.keep_raw_blobs:
+            data = strip_binary_blobs(data)
         metadata.raw.c2pa = data
 
         # Get active manifest
@@ -81,7 +111,7 @@ class C2PAToolExtractor(BaseExtractor):
         c2pa.format = manifest.get("format")
 
         # Instance ID (XMP instance identifier)
-        c2pa.instance_id = manifest.get("instanceId") or manifest.get("instance_id")
+        c2pa.instance_id = first_key(manifest, "instanceId", "instance_id")
 
         # Extract task_id from title (e.g., "b1f75fc641144ddba74f8392297bc898_media.mp4")
         if c2pa.title:
@@ -119,7 +149,7 @@ class C2PAToolExtractor(BaseExtractor):
             time_str = sig_info.get("time")
             if time_str:
                 with contextlib.suppress(ValueError, TypeError):
-                    c2pa.signature_time = datetime.fromisoformat(time_str.replace("Z", "+00:00"))
+                    c2pa.signature_time = parse_iso_datetime(time_str)
 
         # Parse assertions
         assertions = manifest.get("assertions", [])
@@ -141,24 +171,29 @@ class C2PAToolExtractor(BaseExtractor):
 
         validation_status = data.get("validation_status", [])
         if validation_status:
-            c2pa.validation_errors = [
-                status.get("explanation", "") for status in validation_status if status
-            ]
-            # Check for untrusted certificate in validation status
+            # Collect errors and check for untrusted certificates in one pass
+            errors = []
+            has_untrusted = False
             for status in validation_status:
-                if status and "untrusted" in str(status.get("code", "")).lower():
-                    c2pa.cert_trusted = False
-                    break
+                if not status:
+                    continue
+                errors.append(status.get("explanation", ""))
+                if not has_untrusted:
+                    code = str(status.get("code", "")).lower()
+                    has_untrusted = "untrusted" in code
+            c2pa.validation_errors = errors
+            if has_untrusted:
+                c2pa.cert_trusted = False
             # If no trust issues found and not already set, mark as trusted
-            if c2pa.cert_trusted is None and c2pa.validation_state == "Valid":
+            elif c2pa.cert_trusted is None and c2pa.validation_state == "Valid":
                 c2pa.cert_trusted = True
 
         # Extract timestamp authority info from signature_info
         if sig_info:
-            tsa_info = sig_info.get("time_authority", {}) or sig_info.get("tsa", {})
+            tsa_info = first_key(sig_info, "time_authority", "tsa")
             if tsa_info:
                 c2pa.timestamp_validated = True
-                c2pa.timestamp_responder = tsa_info.get("responder") or tsa_info.get("name")
+                c2pa.timestamp_responder = first_key(tsa_info, "responder", "name")
             elif c2pa.signature_time:
                 # Has signature time but unknown if TSA validated
                 c2pa.timestamp_validated = None
@@ -200,19 +235,13 @@ class C2PAToolExtractor(BaseExtractor):
             has_image = False
             has_video = False
             for ingredient in c2pa.ingredients:
-                # Check format or relationship type
                 ing_format = ingredient.get("format", "").lower()
-                relationship = ingredient.get("relationship", "").lower()
-
-                if any(x in ing_format for x in ["image", "jpeg", "jpg", "png", "webp"]):
-                    has_image = True
-                if any(x in ing_format for x in ["video", "mp4", "webm", "mov"]):
+                if any(x in ing_format for x in VIDEO_FORMAT_HINTS):
+                    # A video ingredient decides the mode, no need to look further
                     has_video = True
-
-                # Also check relationship field
-                if "parentOf" in relationship or "inputTo" in relationship:
-                    # This is a source ingredient
-                    pass
+                    break
+                if not has_image:
+                    has_image = any(x in ing_format for x in IMAGE_FORMAT_HINTS)
 
             if has_video:
                 c2pa.generation_mode = "video2video"
@@ -241,8 +270,7 @@ class C2PAToolExtractor(BaseExtractor):
             # Extract digital source type
             source_type = action.get("digitalSourceType", "")
             if source_type:
-                if "/" in source_type:
-                    source_type = source_type.split("/")[-1]
+                source_type = source_type[source_type.rfind("/") + 1 :]
                 c2pa.digital_source_type = source_type
 
             # Parse when timestamp
@@ -250,7 +278,7 @@ class C2PAToolExtractor(BaseExtractor):
             when_str = action.get("when")
             if when_str:
                 with contextlib.suppress(ValueError, TypeError):
-                    when_time = datetime.fromisoformat(str(when_str).replace("Z", "+00:00"))
+                    when_time = parse_iso_datetime(when_str)
 
             # Create action record
             c2pa_action = C2PAAction(
@@ -292,16 +320,16 @@ class C2PAToolExtractor(BaseExtractor):
         generator_name = c2pa.claim_generator or c2pa.software_agent
         if generator_name:
             ai.generator_raw = generator_name
-            for key, value in AI_GENERATORS.items():
-                if key.lower() in generator_name.lower():
-                    ai.generator = value
-                    ai.is_ai_generated = True
-                    break
+            generator = match_ai_generator(generator_name)
+            if generator:
+                ai.generator = generator
+                ai.is_ai_generated = True
 
         # Identify signing authorities
         if c2pa.issuer:
-            for auth in SIGNING_AUTHORITIES:
-                if auth.lower() in c2pa.issuer.lower() and auth not in ai.signing_authorities:
+            issuer_lower = c2pa.issuer.lower()
+            for auth_lower, auth in SIGNING_AUTHORITIES_LOWER:
+                if auth_lower in issuer_lower and auth not in ai.signing_authorities:
                     ai.signing_authorities.append(auth)
 
         # Infer Sora model from resolution (only if generator is Sora)
@@ -358,11 +386,12 @@ def sign_with_c2pa(
             return False, f"Private key file not found: {private_key_path}"
 
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+        result = run_tool(cmd, timeout=120, capture_stderr=True)
         if result.returncode == 0:
             return True, f"Successfully signed: {output_path}"
         else:
-            error_msg = result.stderr or result.stdout or "Unknown error"
+            output = result.stderr or result.stdout
+            error_msg = output.decode("utf-8", "replace") if output else "Unknown error"
             return False, f"Signing failed: {error_msg}"
     except subprocess.TimeoutExpired:
         return False, "Signing timed out after 120 seconds"
@@ -0,0 +1,236 @@
+"""On-disk cache for external tool output.
+
+Re-running aivid on unchanged files would otherwise re-invoke ffprobe,
+exiftool and c2patool and get identical output back. Results are stored as
+JSON under ``~/.cache/aivid/{tool}/`` keyed by the tool version, the file's
+absolute path and a cheap file fingerprint (size, mtime and a hash of the
+first and last 64 KB).
+
+Platform API responses (YouTube/TikTok AI labels) are cached the same way
+under ``~/.cache/aivid/{platform}-api/``, keyed by video ID with a one-week
+TTL.
+
+Caching is opt-in via the ``extraction.cache_enabled`` config option or the
+``AIVID_CACHE`` environment variable.
+"""
+
+import functools
+import hashlib
+import json
+import os
+import subprocess
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, TypeVar
+
+from aivid.config import get_config
+from aivid.utils import fastjson
+from aivid.utils.process import run_tool
+
+T = TypeVar("T")
+
+# Bytes hashed from each end of the file for the fingerprint
+FINGERPRINT_CHUNK = 64 * 1024
+
+# Arguments that print each tool's version
+TOOL_VERSION_ARGS = {
+    "ffprobe": ["-version"],
+    "exiftool": ["-ver"],
+    "c2patool": ["--version"],
+}
+
+# Platform AI labels rarely change once set; refetch them after a week
+API_CACHE_TTL = 7 * 24 * 3600
+
+
+def default_cache_dir() -> Path:
+    """Return the base cache directory (honours XDG_CACHE_HOME)."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "aivid"
+
+
+def file_fingerprint(path: str) -> str:
+    """Compute a cheap content fingerprint for a file.
+
+    Hashes size, modification time and the first/last 64 KB instead of the
+    whole file, so multi-GB videos are fingerprinted in constant time.
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    stat = os.stat(path)
+    digest = hashlib.sha256(f"{stat.st_size}:{stat.st_mtime_ns}".encode())
+    with open(path, "rb") as f:
+        digest.update(f.read(FINGERPRINT_CHUNK))
+        if stat.st_size > FINGERPRINT_CHUNK:
+            f.seek(max(stat.st_size - FINGERPRINT_CHUNK, FINGERPRINT_CHUNK))
+            digest.update(f.read(FINGERPRINT_CHUNK))
+    return digest.hexdigest()
+
+
+@functools.cache
+def tool_version(tool: str) -> str:
+    """Return the first line of a tool's version output ("" if unknown)."""
+    args = TOOL_VERSION_ARGS.get(tool)
+    if not args:
+        return ""
+    try:
+        result = run_tool([tool, *args], timeout=10)
+    except (subprocess.TimeoutExpired, OSError):
+        return ""
+    lines = result.stdout.decode("utf-8", "replace").strip().splitlines()
+    return lines[0] if lines else ""
+
+
+class ToolCache:
+    """JSON cache for one tool (or other namespace) on disk.
+
+    Args:
+        namespace: Subdirectory name, usually the tool name
+        version: Tool version; entries written by other versions are ignored
+        cache_dir: Base directory (default: ``~/.cache/aivid``)
+        ttl: Maximum entry age in seconds (None: entries never expire)
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        version: str = "",
+        cache_dir: Path | None = None,
+        ttl: float | None = None,
+    ) -> None:
+        self.directory = (cache_dir or default_cache_dir()) / namespace
+        self.version = version
+        self.ttl = ttl
+
+    def _entry_path(self, key: str) -> Path:
+        digest = hashlib.sha256(f"{self.version}\0{key}".encode()).hexdigest()
+        return self.directory / f"{digest}.json"
+
+    def get(self, key: str) -> Any | None:
+        """Return the cached value for a key, or None on a miss."""
+        entry = self._entry_path(key)
+        try:
+            if self.ttl is not None and time.time() - entry.stat().st_mtime > self.ttl:
+                return None
+            return fastjson.loads(entry.read_bytes())
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key: str, value: Any) -> None:
+        """Store a JSON-serializable value (errors are ignored)."""
+        entry = self._entry_path(key)
+        try:
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temp file and rename so readers never see partial entries
+            fd, tmp_path = tempfile.mkstemp(dir=entry.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(value, f)
+                os.replace(tmp_path, entry)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except (OSError, TypeError, ValueError):
+            pass
+
+
+def get_tool_cache(tool: str) -> ToolCache | None:
+    """Return the cache for a tool, or None if caching is disabled."""
+    config = get_config().extraction
+    if not config.cache_enabled:
+        return None
+    cache_dir = Path(config.cache_dir).expanduser() if config.cache_dir else None
+    return ToolCache(tool, version=tool_version(tool), cache_dir=cache_dir)
+
+
+def get_api_cache(platform: str) -> ToolCache | None:
+    """Return the cache for a platform API, or None if caching is disabled."""
+    config = get_config().extraction
+    if not config.cache_enabled:
+        return None
+    cache_dir = Path(config.cache_dir).expanduser() if config.cache_dir else None
+    return ToolCache(f"{platform}-api", cache_dir=cache_dir, ttl=API_CACHE_TTL)
+
+
+def cached_api_lookup(
+    platform: str,
+    keys: list[str],
+    fetch: Callable[[list[str]], dict[str, Any] | None],
+) -> dict[str, Any] | None:
+    """Look up API results for several keys, using the disk cache when enabled.
+
+    Only keys missing from the cache are passed to ``fetch``. Not-found
+    results (None) are not cached, so they are retried on the next run.
+
+    Args:
+        platform: Platform name (cache namespace)
+        keys: Keys to look up, usually video IDs
+        fetch: Function that queries the API for a list of keys
+
+    Returns:
+        Result per key (None if not found), or None if nothing could be
+        fetched; keys whose request failed are left out
+    """
+    cache = get_api_cache(platform)
+    if cache is None:
+        return fetch(keys)
+
+    results: dict[str, Any] = {}
+    missing = []
+    for key in keys:
+        cached = cache.get(key)
+        if cached is None:
+            missing.append(key)
+        else:
+            results[key] = cached
+
+    if missing:
+        fetched = fetch(missing)
+        if fetched is None:
+            return results or None
+        for key, value in fetched.items():
+            if value is not None:
+                cache.put(key, value)
+        results.update(fetched)
+    return results
+
+
+def cached_tool_output(tool: str, path: str, run: Callable[[str], T], variant: str = "") -> T:
+    """Return a tool's output for a file, using the disk cache when enabled.
+
+    Empty results (tool failures, files without metadata) are not cached.
+
+    Args:
+        tool: Tool name (cache namespace)
+        path: Path to the media file
+        run: Function that runs the tool on ``path``
+        variant: Distinguishes different invocations of the same tool
+
+    Returns:
+        Cached or freshly computed output
+    """
+    cache = get_tool_cache(tool)
+    if cache is None:
+        return run(path)
+
+    try:
+        # Tool output embeds the path (SourceFile, format.filename), so a moved
+        # or copied file must not reuse the original's entry
+        key = f"{os.path.abspath(path)}:{file_fingerprint(path)}:{variant}"
+    except OSError:
+        return run(path)
+
+    cached: T | None = cache.get(key)
+    if cached is not None:
+        return cached
+
+    result = run(path)
+    if result:
+        cache.put(key, result)
+    return result
@@ -1,14 +1,193 @@
 """ExifTool metadata extractor for XMP, EXIF, IPTC."""
 
 import contextlib
-import json
-import shutil
+import functools
+import os
 import subprocess
+import threading
 from datetime import datetime
+from types import TracebackType
 from typing import Any, ClassVar
 
 from aivid.extractors.base import BaseExtractor
+from aivid.extractors.cache import cached_tool_output
 from aivid.models import VideoMetadata
+from aivid.utils import fastjson
+from aivid.utils.dates import parse_iso_datetime
+from aivid.utils.deps import has_executable
+from aivid.utils.process import run_tool
+
+# Arguments shared by one-shot and stay_open exiftool invocations
+EXIFTOOL_ARGS = [
+    "-json",
+    "-n",  # Numeric output (no units)
+    "-G1",  # Show group names
+    "-s",  # Short tag names
+]
+
+# ExifTool date formats, most common first
+EXIF_DATE_FORMATS = (
+    "%Y:%m:%d %H:%M:%S%z",  # 2024:01:15 12:30:45+08:00
+    "%Y:%m:%d %H:%M:%S",  # 2024:01:15 12:30:45
+    "%Y:%m:%d %H:%M:%S.%f%z",  # With microseconds and TZ
+    "%Y:%m:%d %H:%M:%S.%f",  # With microseconds
+)
+ISO_DATE_FORMATS = (
+    "%Y-%m-%dT%H:%M:%S%z",  # ISO format with TZ
+    "%Y-%m-%dT%H:%M:%S",  # ISO format
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_exiftool_date(date_str: str) -> datetime | None:
+    """Parse an ExifTool date string (cached; files repeat the same dates).
+
+    The character after the year tells EXIF-style (``2024:01:15``) and
+    ISO-style (``2024-01-15``) dates apart, so only one format family is tried.
+    """
+    if date_str[4:5] == ":":
+        for fmt in EXIF_DATE_FORMATS:
+            with contextlib.suppress(ValueError):
+                return datetime.strptime(date_str, fmt)
+        return None
+
+    # Fast path: fromisoformat is implemented in C
+    with contextlib.suppress(ValueError):
+        return parse_iso_datetime(date_str)
+
+    # Offsets like +0800 are only accepted by fromisoformat from Python 3.11
+    for fmt in ISO_DATE_FORMATS:
+        with contextlib.suppress(ValueError):
+            return datetime.strptime(date_str, fmt)
+
+    return None
+
+
+class ExifToolDaemon:
+    """Persistent ``exiftool -stay_open`` worker for batch processing.
+
+    Starting exiftool means starting a Perl interpreter, which costs far more
+    than reading one file's metadata. While a daemon is active (used as a
+    context manager), ExifToolExtractor sends files to a single long-lived
+    exiftool process instead of spawning one per file.
+
+    Args:
+        timeout: Seconds to wait for one file's metadata before the process
+            is killed
+
+    Example:
+        with ExifToolDaemon():
+            results = [analyze_file(p) for p in paths]
+    """
+
+    _active: ClassVar["ExifToolDaemon | None"] = None
+
+    def __init__(self, timeout: float = 30) -> None:
+        self._process: subprocess.Popen[bytes] | None = None
+        self._lock = threading.Lock()
+        # Per-file limit, matching the one-shot invocation
+        self.timeout = timeout
+
+    @classmethod
+    def active(cls) -> "ExifToolDaemon | None":
+        """Return the running daemon, if one is active."""
+        return cls._active
+
+    def __enter__(self) -> "ExifToolDaemon":
+        if ExifToolDaemon._active is None and has_executable("exiftool"):
+            try:
+                self._process = subprocess.Popen(
+                    ["exiftool", "-stay_open", "True", "-@", "-", "-common_args", *EXIFTOOL_ARGS],
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    close_fds=False,
+                )
+                ExifToolDaemon._active = self
+            except OSError:
+                self._process = None
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the exiftool process."""
+        if ExifToolDaemon._active is self:
+            ExifToolDaemon._active = None
+        process, self._process = self._process, None
+        if process is None:
+            return
+        try:
+            if process.stdin:
+                process.stdin.write(b"-stay_open\nFalse\n")
+                process.stdin.flush()
+                process.stdin.close()
+            process.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            process.kill()
+            process.wait()
+        finally:
+            if process.stdout:
+                process.stdout.close()
+
+    def get_metadata(self, path: str) -> dict[str, Any]:
+        """Read metadata for one file through the running exiftool process.
+
+        If exiftool exits or takes longer than ``timeout`` seconds (it is then
+        killed), the daemon stops and later calls raise OSError, so callers
+        fall back to one-shot invocations.
+
+        Args:
+            path: Path to the media file
+
+        Returns:
+            First JSON object from exiftool's output, or empty dict if none
+
+        Raises:
+            OSError: If the daemon is not running, exits unexpectedly or
+                times out
+        """
+        with self._lock:
+            process = self._process
+            if process is None or process.stdin is None or process.stdout is None:
+                raise OSError("exiftool daemon is not running")
+
+            timer = threading.Timer(self.timeout, process.kill)
+            timer.start()
+            try:
+                # Argfile lines starting with "#" are comments; absolute paths never do
+                process.stdin.write(os.fsencode(os.path.abspath(path)) + b"\n-execute\n")
+                process.stdin.flush()
+
+                chunks = []
+                while True:
+                    line = process.stdout.readline()
+                    if not line:
+                        raise OSError("exiftool daemon exited or timed out")
+                    if line.rstrip() == b"{ready}":
+                        break
+                    chunks.append(line)
+            except OSError:
+                self._process = None
+                process.kill()
+                process.communicate()
+                raise
+            finally:
+                timer.cancel()
+
+        output = b"".join(chunks)
+        if output.strip():
+            data = fastjson.loads(output)
+            if data and isinstance(data, list) and isinstance(data[0], dict):
+                first_item: dict[str, Any] = data[0]
+                return first_item
+        return {}
 
 
 class ExifToolExtractor(BaseExtractor):
@@ -29,23 +208,20 @@ class ExifToolExtractor(BaseExtractor):
     priority: ClassVar[int] = 15  # After FFprobe (10), before C2PA (20)
 
     # ExifTool date formats
-    DATE_FORMATS = [
-        "%Y:%m:%d %H:%M:%S%z",  # 2024:01:15 12:30:45+08:00
-        "%Y:%m:%d %H:%M:%S",  # 2024:01:15 12:30:45
-        "%Y-%m-%dT%H:%M:%S%z",  # ISO format with TZ
-        "%Y-%m-%dT%H:%M:%S",  # ISO format
-        "%Y:%m:%d %H:%M:%S.%f%z",  # With microseconds and TZ
-        "%Y:%m:%d %H:%M:%S.%f",  # With microseconds
-    ]
+    DATE_FORMATS = [*EXIF_DATE_FORMATS, *ISO_DATE_FORMATS]
 
     @classmethod
     def is_available(cls) -> bool:
         """Check if exiftool is available."""
-        return shutil.which("exiftool") is not None
+        return has_executable("exiftool")
+
+    def prefetch(self, path: str, metadata: VideoMetadata) -> None:
+        """Run exiftool ahead of extraction."""
+        self._prefetched[path] = self._fetch(path)
 
     def extract(self, path: str, metadata: VideoMetadata) -> None:
         """Extract metadata using exiftool."""
-        exif_data = self._run_exiftool(path)
+        exif_data = self._take_prefetched(path, self._fetch)
         if not exif_data:
             return
 
@@ -58,25 +234,28 @@ class ExifToolExtractor(BaseExtractor):
         self._parse_timestamps(exif_data, metadata)
         self._parse_platform_aigc(exif_data, metadata)
 
+    def _fetch(self, path: str) -> dict[str, Any]:
+        """Return exiftool output, from the disk cache when enabled."""
+        return cached_tool_output(self.name, path, self._run_exiftool)
+
     def _run_exiftool(self, path: str) -> dict[str, Any]:
         """Run exiftool and return JSON output."""
+        # Use the persistent worker in batch mode (it reads one path per line)
+        daemon = ExifToolDaemon.active()
+        if daemon is not None and "\n" not in path:
+            with contextlib.suppress(OSError, ValueError):
+                return daemon.get_metadata(path)
+
         try:
-            cmd = [
-                "exiftool",
-                "-json",
-                "-n",  # Numeric output (no units)
-                "-G1",  # Show group names
-                "-s",  # Short tag names
-                path,
-            ]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+            cmd = ["exiftool", *EXIFTOOL_ARGS, path]
+            result = run_tool(cmd, timeout=30)
             if result.returncode == 0 and result.stdout:
-                data = json.loads(result.stdout)
+                data = fastjson.loads(result.stdout)
                 if data and isinstance(data, list) and len(data) > 0:
                     first_item = data[0]
                     if isinstance(first_item, dict):
                         return first_item  # ExifTool returns a list
-        except (subprocess.TimeoutExpired, json.JSONDecodeError, FileNotFoundError):
+        except (subprocess.TimeoutExpired, fastjson.JSONDecodeError, FileNotFoundError):
             pass
         return {}
 
@@ -85,16 +264,7 @@ class ExifToolExtractor(BaseExtractor):
         if not date_str:
             return None
 
-        # Try known formats
-        for fmt in self.DATE_FORMATS:
-            with contextlib.suppress(ValueError):
-                return datetime.strptime(str(date_str), fmt)
-
-        # Fallback: try ISO format parsing
-        with contextlib.suppress(ValueError, TypeError):
-            return datetime.fromisoformat(str(date_str).replace("Z", "+00:00"))
-
-        return None
+        return _parse_exiftool_date(str(date_str))
 
     def _parse_descriptive(self, data: dict[str, Any], metadata: VideoMetadata) -> None:
         """Parse descriptive metadata from ExifTool output."""
@@ -186,16 +356,18 @@ class ExifToolExtractor(BaseExtractor):
         ]
 
         for key in create_keys:
-            if key in data:
-                parsed = self._parse_date(str(data[key]))
-                if parsed:
-                    # Only update if not already set by higher priority source
-                    if not desc.creation_timestamp.value:
-                        desc.creation_timestamp.value = parsed
-                        desc.creation_timestamp.source = "exiftool"
-                        desc.creation_timestamp.raw_value = str(data[key])
-                        desc.creation_date = parsed
-                    break
+            value = data.get(key)
+            if not value:
+                continue
+            parsed = self._parse_date(value)
+            if parsed:
+                # Only update if not already set by higher priority source
+                if not desc.creation_timestamp.value:
+                    desc.creation_timestamp.value = parsed
+                    desc.creation_timestamp.source = "exiftool"
+                    desc.creation_timestamp.raw_value = str(value)
+                    desc.creation_date = parsed
+                break
 
         # Modification date
         modify_keys = [
@@ -205,15 +377,17 @@ class ExifToolExtractor(BaseExtractor):
         ]
 
         for key in modify_keys:
-            if key in data:
-                parsed = self._parse_date(str(data[key]))
-                if parsed:
-                    if not desc.modification_timestamp.value:
-                        desc.modification_timestamp.value = parsed
-                        desc.modification_timestamp.source = "exiftool"
-                        desc.modification_timestamp.raw_value = str(data[key])
-                        desc.modification_date = parsed
-                    break
+            value = data.get(key)
+            if not value:
+                continue
+            parsed = self._parse_date(value)
+            if parsed:
+                if not desc.modification_timestamp.value:
+                    desc.modification_timestamp.value = parsed
+                    desc.modification_timestamp.source = "exiftool"
+                    desc.modification_timestamp.raw_value = str(value)
+                    desc.modification_date = parsed
+                break
 
     def _parse_platform_aigc(self, data: dict[str, Any], metadata: VideoMetadata) -> None:
         """Parse platform-specific AIGC labels (TikTok, etc.)."""
@@ -225,11 +399,9 @@ class ExifToolExtractor(BaseExtractor):
             # Parse JSON: {"aigc_label_type":2}
             if isinstance(aigc_info, str):
                 try:
-                    import json
-
-                    aigc_data = json.loads(aigc_info)
+                    aigc_data = fastjson.loads(aigc_info)
                     platform.tiktok_aigc_label_type = aigc_data.get("aigc_label_type")
-                except json.JSONDecodeError:
+                except fastjson.JSONDecodeError:
                     pass
             elif isinstance(aigc_info, dict):
                 platform.tiktok_aigc_label_type = aigc_info.get("aigc_label_type")
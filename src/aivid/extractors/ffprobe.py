@@ -1,14 +1,31 @@
 """FFprobe metadata extractor."""
 
 import contextlib
-import json
-import shutil
 import subprocess
-from datetime import datetime
 from typing import Any, ClassVar
 
 from aivid.extractors.base import BaseExtractor
+from aivid.extractors.cache import cached_tool_output
 from aivid.models import VideoMetadata
+from aivid.utils import fastjson
+from aivid.utils.dates import parse_iso_datetime
+from aivid.utils.deps import has_executable
+from aivid.utils.process import run_tool
+
+
+def _parse_rational(value: Any) -> float | None:
+    """Parse an ffprobe rational such as ``"30000/1001"`` into a float.
+
+    Returns None if the value is not ``num/den`` or the denominator is not positive.
+    """
+    num, sep, den = (value if isinstance(value, str) else str(value)).partition("/")
+    if not sep:
+        return None
+    try:
+        denominator = int(den)
+        return int(num) / denominator if denominator > 0 else None
+    except ValueError:
+        return None
 
 
 class FFprobeExtractor(BaseExtractor):
@@ -27,11 +44,15 @@ class FFprobeExtractor(BaseExtractor):
     @classmethod
     def is_available(cls) -> bool:
         """Check if ffprobe is available."""
-        return shutil.which("ffprobe") is not None
+        return has_executable("ffprobe")
+
+    def prefetch(self, path: str, metadata: VideoMetadata) -> None:
+        """Run ffprobe ahead of extraction."""
+        self._prefetched[path] = self._fetch(path)
 
     def extract(self, path: str, metadata: VideoMetadata) -> None:
         """Extract metadata using ffprobe."""
-        probe_data = self._run_ffprobe(path)
+        probe_data = self._take_prefetched(path, self._fetch)
         if not probe_data:
             return
 
@@ -50,10 +71,6 @@ class FFprobeExtractor(BaseExtractor):
         chapters = probe_data.get("chapters", [])
         metadata.raw.chapters = chapters
 
-        # Parse programs
-        programs = probe_data.get("programs", [])
-        metadata.raw.programs = programs
-
         # Store format tags
         format_tags = probe_data.get("format", {}).get("tags", {})
         metadata.raw.format_tags = format_tags
@@ -61,6 +78,10 @@ class FFprobeExtractor(BaseExtractor):
         # Extract descriptive metadata from tags
         self._parse_tags(format_tags, metadata)
 
+    def _fetch(self, path: str) -> dict[str, Any]:
+        """Return ffprobe output, from the disk cache when enabled."""
+        return cached_tool_output(self.name, path, self._run_ffprobe)
+
     def _run_ffprobe(self, path: str) -> dict[str, Any]:
         """Run ffprobe and return JSON output."""
         try:
@@ -72,15 +93,16 @@ class FFprobeExtractor(BaseExtractor):
                 "json",
                 "-show_format",
                 "-show_streams",
+                # raw.chapters is part of every JSON export, not just --full output
                 "-show_chapters",
-                "-show_programs",
                 path,
             ]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+            # ffprobe runs with -v quiet, so only stdout is worth buffering
+            result = run_tool(cmd, timeout=60)
             if result.returncode == 0 and result.stdout:
-                data: dict[str, Any] = json.loads(result.stdout)
+                data: dict[str, Any] = fastjson.loads(result.stdout)
                 return data
-        except (subprocess.TimeoutExpired, json.JSONDecodeError, FileNotFoundError):
+        except (subprocess.TimeoutExpired, fastjson.JSONDecodeError, FileNotFoundError):
             pass
         return {}
 
@@ -105,14 +127,20 @@ class FFprobeExtractor(BaseExtractor):
 
     def _parse_streams(self, streams: list[dict[str, Any]], metadata: VideoMetadata) -> None:
         """Parse stream information."""
+        video = metadata.technical.video
+        audio = metadata.technical.audio
         for stream in streams:
             codec_type = stream.get("codec_type")
 
-            if codec_type == "video" and not metadata.technical.video.codec:
+            if codec_type == "video" and not video.codec:
                 self._parse_video_stream(stream, metadata)
-            elif codec_type == "audio" and not metadata.technical.audio.codec:
+            elif codec_type == "audio" and not audio.codec:
                 self._parse_audio_stream(stream, metadata)
 
+            # Remaining streams (subtitles, data, extra tracks) are not used
+            if video.codec and audio.codec:
+                break
+
     def _parse_video_stream(self, stream: dict[str, Any], metadata: VideoMetadata) -> None:
         """Parse video stream information."""
         video = metadata.technical.video
@@ -126,23 +154,13 @@ class FFprobeExtractor(BaseExtractor):
         video.field_order = stream.get("field_order")
 
         # Parse frame rate
-        fps_str = stream.get("r_frame_rate", "0/1")
-        if "/" in str(fps_str):
-            try:
-                num, den = str(fps_str).split("/")
-                if int(den) > 0:
-                    video.fps = int(num) / int(den)
-            except (ValueError, ZeroDivisionError):
-                pass
-
-        avg_fps_str = stream.get("avg_frame_rate", "0/1")
-        if "/" in str(avg_fps_str):
-            try:
-                num, den = str(avg_fps_str).split("/")
-                if int(den) > 0:
-                    video.avg_fps = int(num) / int(den)
-            except (ValueError, ZeroDivisionError):
-                pass
+        fps = _parse_rational(stream.get("r_frame_rate", "0/1"))
+        if fps is not None:
+            video.fps = fps
+
+        avg_fps = _parse_rational(stream.get("avg_frame_rate", "0/1"))
+        if avg_fps is not None:
+            video.avg_fps = avg_fps
 
         # Parse bitrate
         if "bit_rate" in stream:
@@ -206,7 +224,7 @@ class FFprobeExtractor(BaseExtractor):
         creation_time = tags.get("creation_time")
         if creation_time:
             with contextlib.suppress(ValueError, TypeError):
-                parsed = datetime.fromisoformat(str(creation_time).replace("Z", "+00:00"))
+                parsed = parse_iso_datetime(creation_time)
                 # Only set if not already set by higher priority source (e.g., exiftool)
                 if not desc.creation_timestamp.value:
                     desc.creation_timestamp.value = parsed
@@ -1,5 +1,6 @@
 """Heuristic AI detection based on audio/video characteristics."""
 
+import re
 from typing import ClassVar
 
 from aivid.extractors.base import BaseExtractor
@@ -8,10 +9,16 @@ from aivid.models import VideoMetadata
 # Platform encoder tags that should NOT trigger AI detection
 # These are added by video platforms during transcoding, not by AI generators
 PLATFORM_ENCODER_PATTERNS = [
-    "ISO Media file produced by Google Inc.",  # YouTube transcoding
+    "ISO Media file produced by Google",  # YouTube transcoding ("... Google Inc.")
     "Lavf",  # FFmpeg (common in many platforms)
 ]
 
+# All platform patterns as one alternation, so matching is a single scan
+_PLATFORM_PATTERN = re.compile("|".join(map(re.escape, PLATFORM_ENCODER_PATTERNS)))
+
+# Fact signals set by the platform API extractors (YouTube, TikTok)
+PLATFORM_API_SIGNALS = ("youtube_api_synthetic", "tiktok_api_aigc")
+
 
 class HeuristicDetector(BaseExtractor):
     """Detect AI-generated content using heuristic signals.
@@ -42,8 +49,17 @@ class HeuristicDetector(BaseExtractor):
 
         All signals from this detector are ANALYSIS (is_fact=False)
         because they are inferred from patterns, not direct AI declarations.
+        Overall confidence only goes up (see ``AIDetectionResult.add_signal``);
+        a weak heuristic signal never lowers what an earlier extractor set.
         """
         ai = metadata.ai_detection
+
+        # A platform API label is authoritative and leaves nothing to infer
+        if ai.confidence >= 0.99 and any(
+            name in ai.signals and ai.signals[name].detected for name in PLATFORM_API_SIGNALS
+        ):
+            return
+
         tech = metadata.technical
 
         # Check if this looks like a platform-transcoded video
@@ -94,13 +110,6 @@ class HeuristicDetector(BaseExtractor):
                     is_fact=False,  # Analysis: weak signal, may indicate Luma
                 )
 
-        # Calculate overall confidence
-        if ai.signals:
-            detected_signals = [s for s in ai.signals.values() if s.detected]
-            if detected_signals:
-                # Use highest signal confidence
-                ai.confidence = max(s.confidence for s in detected_signals)
-
     def _is_platform_transcoded(self, handler: str, format_encoder: str) -> bool:
         """Check if video appears to be transcoded by a platform (YouTube, etc.).
 
@@ -114,13 +123,7 @@ class HeuristicDetector(BaseExtractor):
             True if video appears to be platform-transcoded
         """
         # Check for known platform patterns
-        for pattern in PLATFORM_ENCODER_PATTERNS:
-            if pattern in handler:
-                return True
-
-        # YouTube/Google platform transcoding
-        # "ISO Media file produced by Google Inc." is YouTube's transcoder
-        if "ISO Media file produced by Google" in handler:
+        if _PLATFORM_PATTERN.search(handler):
             return True
 
         # Format encoder "Google" alone (without Veo) is just platform encoding
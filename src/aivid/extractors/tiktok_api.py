@@ -21,14 +21,30 @@ available to academic and research applications.
 
 from __future__ import annotations
 
+import os
+import re
+import threading
+import time
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, ClassVar
 
 from aivid.config import get_config
 from aivid.extractors.base import BaseExtractor
-from aivid.models import AISignal, VideoMetadata
+from aivid.extractors.cache import cached_api_lookup
+from aivid.models import AISignal, SourcePlatform, VideoMetadata
+from aivid.utils import fastjson
 
 if TYPE_CHECKING:
-    pass
+    import httpx
+
+# TikTok video IDs are numeric
+_TT_ID = re.compile(r"(\d{15,25})")
+
+
+def _video_id_from_filename(path: str) -> str | None:
+    """Extract a TikTok video ID from a filename (e.g. tiktok_VIDEO_ID.mp4)."""
+    match = _TT_ID.search(Path(path).stem)
+    return match.group(1) if match else None
 
 
 class TikTokAPIExtractor(BaseExtractor):
@@ -46,6 +62,16 @@ class TikTokAPIExtractor(BaseExtractor):
 
     AUTH_URL = "https://open.tiktokapis.com/v2/oauth/token/"
     QUERY_URL = "https://open.tiktokapis.com/v2/research/video/query/"
+    BATCH_SIZE = 20  # Video IDs per query request
+
+    _client: ClassVar[httpx.Client | None] = None
+    _client_lock: ClassVar[threading.Lock] = threading.Lock()
+    # OAuth token shared across lookups until shortly before it expires
+    _token: ClassVar[str | None] = None
+    _token_expires: ClassVar[float] = 0.0
+    _token_lock: ClassVar[threading.Lock] = threading.Lock()
+    # video_tag objects from prefetch_batch(), keyed by video ID (None: not found)
+    _batch_tags: ClassVar[dict[str, dict[str, Any] | None]] = {}
 
     @classmethod
     def is_available(cls) -> bool:
@@ -61,6 +87,67 @@ class TikTokAPIExtractor(BaseExtractor):
             and config.api_keys.tiktok_client_secret is not None
         )
 
+    @classmethod
+    def _get_client(cls) -> httpx.Client:
+        """Return the shared HTTP client, creating it on first use.
+
+        Reusing one client keeps connections alive across videos instead of
+        opening a new TLS connection for every request.
+        """
+        import httpx
+
+        with cls._client_lock:
+            if cls._client is None:
+                cls._client = httpx.Client(
+                    timeout=30, limits=httpx.Limits(max_keepalive_connections=16)
+                )
+            return cls._client
+
+    @classmethod
+    def prefetch_batch(cls, paths: list[str]) -> None:
+        """Look up the videos named by many files in as few API calls as possible.
+
+        IDs are taken from the filenames and queried up to 20 per request;
+        :meth:`extract` then reads the results instead of querying per file.
+
+        Args:
+            paths: Paths to the video files
+        """
+        video_ids = list(dict.fromkeys(filter(None, map(_video_id_from_filename, paths))))
+        for start in range(0, len(video_ids), cls.BATCH_SIZE):
+            tags = cls._fetch_tags(video_ids[start : start + cls.BATCH_SIZE])
+            if tags is not None:
+                cls._batch_tags.update(tags)
+
+    @classmethod
+    def release_batch(cls) -> None:
+        """Drop results stored by :meth:`prefetch_batch`."""
+        cls._batch_tags.clear()
+
+    @classmethod
+    def batch_state(cls) -> dict[str, dict[str, Any] | None] | None:
+        """Return results stored by :meth:`prefetch_batch`, if any."""
+        return dict(cls._batch_tags) or None
+
+    @classmethod
+    def restore_batch(cls, state: dict[str, dict[str, Any] | None]) -> None:
+        """Load results looked up by :meth:`prefetch_batch` in another process."""
+        cls._batch_tags.update(state)
+
+    def prefetch(self, path: str, metadata: VideoMetadata) -> None:
+        """Query the API for the video :meth:`extract` will look up.
+
+        Runs concurrently with the other extractors' tool invocations, so the
+        HTTP round trips overlap local extraction instead of adding to it.
+        """
+        video_id = self._get_video_id(path, metadata)
+        if not video_id or video_id in self._batch_tags:
+            return
+
+        tags = self._fetch_tags([video_id])
+        if tags is not None:
+            self._prefetched[path] = tags
+
     def extract(self, path: str, metadata: VideoMetadata) -> None:
         """Query TikTok API for AI content labels.
 
@@ -72,12 +159,15 @@ class TikTokAPIExtractor(BaseExtractor):
             path: Path to the video file
             metadata: VideoMetadata object to populate
         """
+        # video_tag objects looked up by prefetch(), keyed by video ID
+        prefetched = self._prefetched.pop(path, {})
+
         # Try to get video_id from source info or embedded metadata
         video_id = self._get_video_id(path, metadata)
         if not video_id:
             return
 
-        self._query_api(video_id, metadata)
+        self._query_api(video_id, metadata, prefetched)
 
     def _get_video_id(self, path: str, metadata: VideoMetadata) -> str | None:
         """Extract TikTok video ID from source info or metadata.
@@ -90,11 +180,12 @@ class TikTokAPIExtractor(BaseExtractor):
             TikTok video ID (numeric string) or None
         """
         # Check if we have source info from download
-        if hasattr(metadata, "source") and metadata.source:
-            from aivid.models.source import SourcePlatform
-
-            if metadata.source.platform == SourcePlatform.TIKTOK:
-                return metadata.source.video_id
+        if (
+            hasattr(metadata, "source")
+            and metadata.source
+            and metadata.source.platform == SourcePlatform.TIKTOK
+        ):
+            return metadata.source.video_id
 
         # Check platform AIGC metadata (may have been extracted by ExifTool)
         if metadata.provenance.platform_aigc.tiktok_video_id:
@@ -105,90 +196,132 @@ class TikTokAPIExtractor(BaseExtractor):
             return vid
 
         # Try to extract from filename (common pattern: tiktok_VIDEO_ID.mp4)
-        import re
-        from pathlib import Path
-
-        filename = Path(path).stem
-        # TikTok video IDs are numeric
-        match = re.search(r"(\d{15,25})", filename)
-        if match:
-            return match.group(1)
-
-        return None
+        return _video_id_from_filename(path)
 
-    def _get_access_token(self) -> str | None:
+    @classmethod
+    def _get_access_token(cls) -> str | None:
         """Get OAuth2 access token for TikTok Research API.
 
+        Tokens are valid for about two hours, so one is cached on the class
+        and only refreshed a minute before it expires.
+
         Returns:
             Access token string or None if authentication fails
         """
         import httpx
 
-        config = get_config()
+        with cls._token_lock:
+            if cls._token and time.monotonic() < cls._token_expires - 60:
+                return cls._token
+
+            config = get_config()
+
+            try:
+                response = cls._get_client().post(
+                    cls.AUTH_URL,
+                    data={
+                        "client_key": config.api_keys.tiktok_client_key,
+                        "client_secret": config.api_keys.tiktok_client_secret,
+                        "grant_type": "client_credentials",
+                    },
+                )
+                response.raise_for_status()
+                data: dict[str, Any] = fastjson.loads(response.content)
+            except httpx.HTTPError:
+                return None
 
-        try:
-            response = httpx.post(
-                self.AUTH_URL,
-                data={
-                    "client_key": config.api_keys.tiktok_client_key,
-                    "client_secret": config.api_keys.tiktok_client_secret,
-                    "grant_type": "client_credentials",
-                },
-                timeout=30,
-            )
-            response.raise_for_status()
-            data: dict[str, Any] = response.json()
             token = data.get("access_token")
-            return str(token) if token else None
-        except httpx.HTTPError:
-            return None
+            if not token:
+                return None
+            cls._token = str(token)
+            cls._token_expires = time.monotonic() + float(data.get("expires_in") or 0)
+            return cls._token
 
-    def _query_api(self, video_id: str, metadata: VideoMetadata) -> None:
-        """Query TikTok Research API and update metadata.
+    @classmethod
+    def _fetch_tags(cls, video_ids: list[str]) -> dict[str, dict[str, Any] | None] | None:
+        """Fetch video_tag objects, reading the disk cache first when enabled.
 
         Args:
-            video_id: TikTok video ID
-            metadata: VideoMetadata object to populate
+            video_ids: TikTok video IDs (at most 20)
+
+        Returns:
+            video_tag dict per ID (None if not found), or None if the request
+            failed
+        """
+        return cached_api_lookup("tiktok", video_ids, cls._request_tags)
+
+    @classmethod
+    def _request_tags(cls, video_ids: list[str]) -> dict[str, dict[str, Any] | None] | None:
+        """Fetch video_tag objects for several videos in one query.
+
+        Args:
+            video_ids: TikTok video IDs
+
+        Returns:
+            video_tag dict per requested ID (None if not found), or None if
+            the request failed
         """
         import httpx
 
-        access_token = self._get_access_token()
+        access_token = cls._get_access_token()
         if not access_token:
-            return
+            return None
 
         try:
-            response = httpx.post(
-                self.QUERY_URL,
+            response = cls._get_client().post(
+                cls.QUERY_URL,
                 params={"fields": "id,video_tag"},
                 headers={"Authorization": f"Bearer {access_token}"},
                 json={
-                    "query": {"and": [{"field_name": "video_id", "field_values": [video_id]}]},
-                    "max_count": 1,
+                    "query": {"and": [{"field_name": "video_id", "field_values": video_ids}]},
+                    "max_count": len(video_ids),
                 },
-                timeout=30,
             )
             response.raise_for_status()
-            data = response.json()
-
-            videos = data.get("data", {}).get("videos", [])
-            if not videos:
-                return  # Video not found
-
-            video = videos[0]
-            video_tag = video.get("video_tag", {})
+            data = fastjson.loads(response.content)
+        except httpx.HTTPError:
+            # Graceful degradation - API errors don't fail the extraction
+            return None
 
-            # Update platform AIGC info
-            platform_aigc = metadata.provenance.platform_aigc
-            platform_aigc.tiktok_api_video_tag_number = video_tag.get("number")
-            platform_aigc.tiktok_api_video_tag_type = video_tag.get("type")
+        tags: dict[str, dict[str, Any] | None] = dict.fromkeys(video_ids)
+        for video in data.get("data", {}).get("videos", []):
+            tags[str(video.get("id"))] = video.get("video_tag", {})
+        return tags
 
-            # If TikTok says it's AI-generated, update AI detection
-            if platform_aigc.is_tiktok_api_ai_labeled:
-                self._update_ai_detection(metadata, video_id, video_tag)
+    def _query_api(
+        self,
+        video_id: str,
+        metadata: VideoMetadata,
+        prefetched: dict[str, dict[str, Any] | None] | None = None,
+    ) -> None:
+        """Query TikTok Research API and update metadata.
 
-        except httpx.HTTPError:
-            # Graceful degradation - API errors don't fail the extraction
-            pass
+        Args:
+            video_id: TikTok video ID
+            metadata: VideoMetadata object to populate
+            prefetched: video_tag objects already fetched for this file, keyed by video ID
+        """
+        if prefetched and video_id in prefetched:
+            video_tag = prefetched[video_id]
+        elif video_id in self._batch_tags:
+            video_tag = self._batch_tags[video_id]
+        else:
+            tags = self._fetch_tags([video_id])
+            if tags is None:
+                return
+            video_tag = tags.get(video_id)
+
+        if video_tag is None:
+            return  # Video not found
+
+        # Update platform AIGC info
+        platform_aigc = metadata.provenance.platform_aigc
+        platform_aigc.tiktok_api_video_tag_number = video_tag.get("number")
+        platform_aigc.tiktok_api_video_tag_type = video_tag.get("type")
+
+        # If TikTok says it's AI-generated, update AI detection
+        if platform_aigc.is_tiktok_api_ai_labeled:
+            self._update_ai_detection(metadata, video_id, video_tag)
 
     def _update_ai_detection(
         self, metadata: VideoMetadata, video_id: str, video_tag: dict[str, Any]
@@ -202,6 +335,7 @@ class TikTokAPIExtractor(BaseExtractor):
         """
         ai = metadata.ai_detection
         ai.is_ai_generated = True
+        ai.confidence = max(ai.confidence, 0.99)
 
         # Determine label source
         tag_number = video_tag.get("number", 0)
@@ -215,3 +349,21 @@ class TikTokAPIExtractor(BaseExtractor):
             description=f"TikTok API: video_tag.type=AIGC Type ({label_source}, video: {video_id})",
             is_fact=True,  # Direct platform declaration, not inference
         )
+
+
+def _reset_after_fork() -> None:
+    """Forget the parent's HTTP client and OAuth token in a forked child process.
+
+    The client's keep-alive sockets still belong to the parent, so the child
+    drops the reference without closing it and opens its own on first use.
+    The token is dropped with it, so the child authenticates on its own client.
+    """
+    TikTokAPIExtractor._client = None
+    TikTokAPIExtractor._client_lock = threading.Lock()
+    TikTokAPIExtractor._token = None
+    TikTokAPIExtractor._token_expires = 0.0
+    TikTokAPIExtractor._token_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
@@ -1,10 +1,10 @@
 """Output formatters for aivid."""
 
 from .c2pa import format_c2pa
-from .default import format_default
-from .full import format_full
+from .default import format_default, write_default
+from .full import format_full, write_full
 from .json import format_json, format_json_list, to_dict
-from .quiet import format_quiet, format_quiet_list
+from .quiet import format_quiet, format_quiet_list, write_quiet_list
 
 __all__ = [
     "format_default",
@@ -15,4 +15,7 @@ __all__ = [
     "format_quiet",
     "format_quiet_list",
     "to_dict",
+    "write_default",
+    "write_full",
+    "write_quiet_list",
 ]
@@ -1,7 +1,16 @@
 """C2PA focused output formatter - AI detection report."""
 
+import io
+
 from aivid.models import VideoMetadata
 
+_BANNER = "=" * 70
+
+_RULE = "-" * 40
+
+# Signal status icons, indexed by AISignal.detected
+_SIGNAL_ICONS = ("✗", "✓")
+
 
 def format_c2pa(metadata: VideoMetadata) -> str:
     """Format metadata as C2PA/AI detection focused output.
@@ -11,48 +20,49 @@ def format_c2pa(metadata: VideoMetadata) -> str:
     - AI generation indicators
     - Detection confidence levels
     """
-    lines = []
+    buf = io.StringIO()
+    w = buf.write
     filename = metadata.filename
 
-    lines.append("=" * 70)
-    lines.append("C2PA / AI CONTENT DETECTION REPORT")
-    lines.append("=" * 70)
-    lines.append("")
+    w(_BANNER + "\n")
+    w("C2PA / AI CONTENT DETECTION REPORT\n")
+    w(_BANNER + "\n")
+    w("\n")
 
     # Quick summary
-    lines.append(f"File: {filename}")
-    lines.append(f"Size: {metadata.file_info.size_human}")
-    lines.append("")
+    w(f"File: {filename}\n")
+    w(f"Size: {metadata.file_info.size_human}\n")
+    w("\n")
 
     # C2PA Detection Result
     c2pa = metadata.provenance.c2pa
     if c2pa.has_c2pa:
-        lines.append("[+] C2PA METADATA DETECTED")
-        lines.append("-" * 40)
-        lines.append(f"  Source: {c2pa.source}")
-        lines.append(f"  Manifest ID: {c2pa.manifest_id}")
+        w("[+] C2PA METADATA DETECTED\n")
+        w(_RULE + "\n")
+        w(f"  Source: {c2pa.source}\n")
+        w(f"  Manifest ID: {c2pa.manifest_id}\n")
         if c2pa.title:
-            lines.append(f"  Title: {c2pa.title}")
+            w(f"  Title: {c2pa.title}\n")
         if c2pa.claim_generator:
-            lines.append(f"  Claim Generator: {c2pa.claim_generator}")
+            w(f"  Claim Generator: {c2pa.claim_generator}\n")
         if c2pa.issuer:
-            lines.append(f"  Issuer: {c2pa.issuer}")
+            w(f"  Issuer: {c2pa.issuer}\n")
         if c2pa.signer_name:
-            lines.append(f"  Signer: {c2pa.signer_name}")
+            w(f"  Signer: {c2pa.signer_name}\n")
         if c2pa.signature_time:
-            lines.append(f"  Signed: {c2pa.signature_time.strftime('%Y-%m-%d %H:%M:%S UTC')}")
+            w(f"  Signed: {c2pa.signature_time.strftime('%Y-%m-%d %H:%M:%S UTC')}\n")
         if c2pa.digital_source_type:
-            lines.append(f"  Digital Source Type: {c2pa.digital_source_type}")
+            w(f"  Digital Source Type: {c2pa.digital_source_type}\n")
         if c2pa.validation_state:
-            lines.append(f"  Validation: {c2pa.validation_state}")
+            w(f"  Validation: {c2pa.validation_state}\n")
     else:
-        lines.append("[-] NO C2PA METADATA FOUND")
+        w("[-] NO C2PA METADATA FOUND\n")
 
-    lines.append("")
+    w("\n")
 
     # AI Generation Indicators
-    lines.append("## AI GENERATION INDICATORS")
-    lines.append("-" * 40)
+    w("## AI GENERATION INDICATORS\n")
+    w(_RULE + "\n")
 
     ai = metadata.ai_detection
     tech = metadata.technical
@@ -61,26 +71,26 @@ def format_c2pa(metadata: VideoMetadata) -> str:
     if tech.audio.sample_rate:
         rate = tech.audio.sample_rate
         indicator = " [SORA SIGNATURE]" if rate == 96000 else ""
-        lines.append(f"  Audio sample rate: {rate} Hz{indicator}")
+        w(f"  Audio sample rate: {rate} Hz{indicator}\n")
 
     # Show encoder
     if tech.video.encoder:
-        lines.append(f"  Encoder: {tech.video.encoder}")
+        w(f"  Encoder: {tech.video.encoder}\n")
 
     # Show handler
     if tech.video.handler:
-        lines.append(f"  Handler: {tech.video.handler}")
+        w(f"  Handler: {tech.video.handler}\n")
 
     # Format tags encoder
     format_encoder = metadata.raw.format_tags.get("encoder")
     if format_encoder:
-        lines.append(f"  Format encoder: {format_encoder}")
+        w(f"  Format encoder: {format_encoder}\n")
 
-    lines.append("")
+    w("\n")
 
     # Detection Signals
-    lines.append("## DETECTION SIGNALS")
-    lines.append("-" * 40)
+    w("## DETECTION SIGNALS\n")
+    w(_RULE + "\n")
 
     if ai.signals:
         # Separate facts from analysis
@@ -88,57 +98,55 @@ def format_c2pa(metadata: VideoMetadata) -> str:
         analysis = {k: v for k, v in ai.signals.items() if not v.is_fact}
 
         if facts:
-            lines.append("  [FACT - directly from metadata]")
+            w("  [FACT - directly from metadata]\n")
             for _name, signal in facts.items():
                 confidence = f"{signal.confidence * 100:.0f}%"
-                icon = "✓" if signal.detected else "✗"
-                lines.append(f"  {icon} [{confidence:>4}] {signal.name}")
+                w(f"  {_SIGNAL_ICONS[signal.detected]} [{confidence:>4}] {signal.name}\n")
                 if signal.description:
-                    lines.append(f"           {signal.description}")
+                    w(f"           {signal.description}\n")
 
         if analysis:
-            lines.append("  [ANALYSIS - inferred from patterns]")
+            w("  [ANALYSIS - inferred from patterns]\n")
             for _name, signal in analysis.items():
                 confidence = f"{signal.confidence * 100:.0f}%"
-                icon = "✓" if signal.detected else "✗"
-                lines.append(f"  {icon} [{confidence:>4}] {signal.name}")
+                w(f"  {_SIGNAL_ICONS[signal.detected]} [{confidence:>4}] {signal.name}\n")
                 if signal.description:
-                    lines.append(f"           {signal.description}")
+                    w(f"           {signal.description}\n")
     else:
-        lines.append("  No AI detection signals found")
-        lines.append("  (This does NOT mean the video is not AI-generated)")
+        w("  No AI detection signals found\n")
+        w("  (This does NOT mean the video is not AI-generated)\n")
 
-    lines.append("")
+    w("\n")
 
     # Detection Summary
-    lines.append("## DETECTION SUMMARY")
-    lines.append("-" * 40)
+    w("## DETECTION SUMMARY\n")
+    w(_RULE + "\n")
 
     if ai.is_ai_generated:
-        lines.append("  ✓ AI-GENERATED CONTENT DETECTED")
+        w("  ✓ AI-GENERATED CONTENT DETECTED\n")
         if ai.generator:
-            lines.append(f"    Generator: {ai.generator}")
-        lines.append(f"    Confidence: {ai.confidence * 100:.0f}%")
+            w(f"    Generator: {ai.generator}\n")
+        w(f"    Confidence: {ai.confidence * 100:.0f}%\n")
     else:
-        lines.append("  No conclusive AI generation evidence found")
+        w("  No conclusive AI generation evidence found\n")
 
-    lines.append("")
+    w("\n")
 
     # Video Info for context
-    lines.append("## VIDEO INFO")
-    lines.append("-" * 40)
+    w("## VIDEO INFO\n")
+    w(_RULE + "\n")
     video = tech.video
     if video.width and video.height:
-        lines.append(f"  Resolution: {video.width}x{video.height}")
+        w(f"  Resolution: {video.width}x{video.height}\n")
     if video.fps:
-        lines.append(f"  Frame rate: {video.fps:.0f} fps")
+        w(f"  Frame rate: {video.fps:.0f} fps\n")
     if tech.duration:
-        lines.append(f"  Duration: {tech.duration_formatted}")
+        w(f"  Duration: {tech.duration_formatted}\n")
     if video.codec:
         profile = f" ({video.profile})" if video.profile else ""
-        lines.append(f"  Codec: {video.codec}{profile}")
+        w(f"  Codec: {video.codec}{profile}\n")
 
-    lines.append("")
-    lines.append("=" * 70)
+    w("\n")
+    w(_BANNER)
 
-    return "\n".join(lines)
+    return buf.getvalue()
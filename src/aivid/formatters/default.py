@@ -1,182 +1,214 @@
 """Default output formatter - concise AI video analysis."""
 
+import functools
+import io
 import re
+from collections.abc import Callable
 
 from aivid.models import VideoMetadata
 
+_BANNER = "=" * 70
+
+_TS_FMT = "%Y-%m-%d %H:%M:%S UTC"
+
+# Display names for common C2PA signature algorithms
+_SIG_ALG_NAMES = {
+    "ES256": "ECDSA P-256",
+    "ES384": "ECDSA P-384",
+    "ES512": "ECDSA P-521",
+    "PS256": "RSA-PSS SHA-256",
+    "PS384": "RSA-PSS SHA-384",
+    "PS512": "RSA-PSS SHA-512",
+}
+
+# Watermark detector display names ("audioseal" -> "Audioseal"), reused across files
+_detector_label = functools.cache(str.capitalize)
+
+# Task UUID prefix in titles like "e9eb1f95b29946bbbbcb0f2eba129c17_media.mp4"
+_TASK_ID_RE = re.compile(r"([a-f0-9]{32})_")
 
-def format_default(metadata: VideoMetadata) -> str:
-    """Format metadata as concise default output.
+
+def write_default(metadata: VideoMetadata, w: Callable[[str], object]) -> None:
+    """Write metadata as concise default output.
 
     Focuses on AI video analysis with:
     - AI generation info (generator, created time, title)
     - Video specs (duration, resolution, fps, size)
     - C2PA validation status
+
+    Args:
+        metadata: Metadata to format
+        w: Write function (e.g. ``sys.stdout.write``); the output has no
+            trailing newline
     """
-    lines = []
     filename = metadata.filename
 
-    lines.append("=" * 70)
-    lines.append(f"File: {filename}")
-    lines.append("=" * 70)
+    w(_BANNER + "\n")
+    w(f"File: {filename}\n")
+    w(_BANNER + "\n")
 
     # Source section (if video was downloaded from URL)
     source = metadata.source
     if source.is_from_url:
-        lines.append("")
-        lines.append("## SOURCE")
-        lines.append(f"  Platform:     {source.platform.value.capitalize()}")
+        w("\n")
+        w("## SOURCE\n")
+        w(f"  Platform:     {source.platform.display_name}\n")
         if source.original_url:
-            lines.append(f"  URL:          {source.original_url}")
+            w(f"  URL:          {source.original_url}\n")
         if source.video_id:
-            lines.append(f"  Video ID:     {source.video_id}")
+            w(f"  Video ID:     {source.video_id}\n")
         if source.uploader:
-            lines.append(f"  Uploader:     {source.uploader}")
+            w(f"  Uploader:     {source.uploader}\n")
         if source.title:
-            lines.append(f"  Title:        {source.title}")
+            w(f"  Title:        {source.title}\n")
 
     # AI Generation section (if C2PA or AI detected)
-    c2pa = metadata.provenance.c2pa
+    prov = metadata.provenance
+    c2pa = prov.c2pa
     ai = metadata.ai_detection
     desc = metadata.descriptive
-    platform_aigc = metadata.provenance.platform_aigc
+    platform_aigc = prov.platform_aigc
 
     if c2pa.has_c2pa or ai.is_ai_generated:
-        lines.append("")
-        lines.append("## AI GENERATION")
+        w("\n")
+        w("## AI GENERATION\n")
 
         # Generator
         generator = ai.generator or c2pa.claim_generator or "Unknown"
-        lines.append(f"  Generator:    {generator}")
+        w(f"  Generator:    {generator}\n")
 
         # Creation time - prefer creation_timestamp with source attribution
         creation_ts = desc.creation_timestamp
         if creation_ts.value:
-            time_str = creation_ts.value.strftime("%Y-%m-%d %H:%M:%S UTC")
+            time_str = creation_ts.value.strftime(_TS_FMT)
             ts_source = creation_ts.source or "unknown"
-            lines.append(f"  Created:      {time_str} (source: {ts_source})")
+            w(f"  Created:      {time_str} (source: {ts_source})\n")
         elif c2pa.signature_time:
             # Fallback to signature_time
-            time_str = c2pa.signature_time.strftime("%Y-%m-%d %H:%M:%S UTC")
-            lines.append(f"  Created:      {time_str} (source: c2pa signature)")
+            time_str = c2pa.signature_time.strftime(_TS_FMT)
+            w(f"  Created:      {time_str} (source: c2pa signature)\n")
 
         # Title
         if c2pa.title:
-            lines.append(f"  Title:        {c2pa.title}")
+            w(f"  Title:        {c2pa.title}\n")
 
             # Task ID (Internal ID) - prefer model field, fallback to regex extraction
             if c2pa.task_id:
-                lines.append(f"  Task ID:      {c2pa.task_id}")
+                w(f"  Task ID:      {c2pa.task_id}\n")
             else:
                 # Fallback: extract UUID from title like "e9eb1f95b29946bbbbcb0f2eba129c17_media.mp4"
-                match = re.match(r"([a-f0-9]{32})_", c2pa.title)
+                # (cheap separator check first; most titles are not task IDs)
+                title = c2pa.title
+                match = _TASK_ID_RE.match(title) if title[32:33] == "_" else None
                 if match:
-                    lines.append(f"  Task ID:      {match.group(1)}")
+                    w(f"  Task ID:      {match.group(1)}\n")
 
         # Instance ID (XMP unique identifier)
         if c2pa.instance_id:
-            lines.append(f"  Instance ID:  {c2pa.instance_id}")
+            w(f"  Instance ID:  {c2pa.instance_id}\n")
 
         # Digital source type
         if c2pa.digital_source_type:
-            lines.append(f"  Source Type:  {c2pa.digital_source_type}")
+            w(f"  Source Type:  {c2pa.digital_source_type}\n")
 
         # Generation mode - prefer model field, fallback to inference [ANALYSIS]
         if c2pa.generation_mode:
-            lines.append(f"  Gen Mode:     {c2pa.generation_mode} [ANALYSIS]")
+            w(f"  Gen Mode:     {c2pa.generation_mode} [ANALYSIS]\n")
         elif c2pa.has_c2pa:
             gen_mode = "image/video-to-video" if c2pa.ingredient_count > 0 else "text-to-video"
-            lines.append(f"  Gen Mode:     {gen_mode} [ANALYSIS]")
+            w(f"  Gen Mode:     {gen_mode} [ANALYSIS]\n")
 
         # Signer info
-        if c2pa.issuer and c2pa.signer_name:
-            lines.append(f"  Signed By:    {c2pa.issuer} ({c2pa.signer_name})")
-        elif c2pa.issuer:
-            lines.append(f"  Signed By:    {c2pa.issuer}")
+        issuer, signer_name = c2pa.issuer, c2pa.signer_name
+        if issuer and signer_name:
+            w(f"  Signed By:    {issuer} ({signer_name})\n")
+        elif issuer:
+            w(f"  Signed By:    {issuer}\n")
 
         # Actions
         if c2pa.actions:
             action_names = [a.action for a in c2pa.actions]
-            lines.append(f"  Actions:      {', '.join(action_names)}")
+            w(f"  Actions:      {', '.join(action_names)}\n")
 
         # Ingredients (important: distinguishes text-to-video vs image/video-to-video)
         if c2pa.ingredient_count > 0:
-            lines.append(f"  Ingredients:  {c2pa.ingredient_count} item(s)")
+            w(f"  Ingredients:  {c2pa.ingredient_count} item(s)\n")
         else:
-            lines.append("  Ingredients:  None")
+            w("  Ingredients:  None\n")
 
     # Platform AIGC section (TikTok embedded metadata)
     if platform_aigc.has_tiktok_metadata:
-        lines.append("")
-        lines.append("## PLATFORM AIGC (TikTok)")
+        w("\n")
+        w("## PLATFORM AIGC (TikTok)\n")
 
         # AIGC label type
-        if platform_aigc.tiktok_aigc_label_type is not None:
-            label_desc = "AI Generated" if platform_aigc.tiktok_aigc_label_type == 2 else "Unknown"
-            lines.append(f"  AIGC Label:   {platform_aigc.tiktok_aigc_label_type} ({label_desc})")
+        label_type = platform_aigc.tiktok_aigc_label_type
+        if label_type is not None:
+            label_desc = "AI Generated" if label_type == 2 else "Unknown"
+            w(f"  AIGC Label:   {label_type} ({label_desc})\n")
         else:
-            lines.append("  AIGC Label:   None (Human Content)")
+            w("  AIGC Label:   None (Human Content)\n")
 
         # Video ID
         if platform_aigc.tiktok_video_id:
-            lines.append(f"  Video ID:     {platform_aigc.tiktok_video_id}")
+            w(f"  Video ID:     {platform_aigc.tiktok_video_id}\n")
 
         # Video MD5
         if platform_aigc.tiktok_video_md5:
-            lines.append(f"  Video MD5:    {platform_aigc.tiktok_video_md5}")
+            w(f"  Video MD5:    {platform_aigc.tiktok_video_md5}\n")
 
     # YouTube API section (from YouTube Data API v3)
     if platform_aigc.youtube_contains_synthetic_media is not None:
-        lines.append("")
-        lines.append("## YOUTUBE API")
+        w("\n")
+        w("## YOUTUBE API\n")
         if platform_aigc.youtube_video_id:
-            lines.append(f"  Video ID:     {platform_aigc.youtube_video_id}")
+            w(f"  Video ID:     {platform_aigc.youtube_video_id}\n")
         if platform_aigc.youtube_contains_synthetic_media:
-            lines.append("  AI Label:     Yes - Contains Synthetic Media")
+            w("  AI Label:     Yes - Contains Synthetic Media\n")
         else:
-            lines.append("  AI Label:     No AI label detected")
+            w("  AI Label:     No AI label detected\n")
 
     # Watermark Detection section
-    watermarks = metadata.provenance.watermarks
+    watermarks = prov.watermarks
     if watermarks.detections:
-        lines.append("")
-        lines.append("## WATERMARK DETECTION")
+        w("\n")
+        w("## WATERMARK DETECTION\n")
         for detection in watermarks.detections:
             icon = "Yes" if detection.detected else "No"
             conf_str = f" ({detection.confidence:.1%})" if detection.detected else ""
-            lines.append(f"  {detection.detector.capitalize()}:    {icon}{conf_str}")
+            w(f"  {_detector_label(detection.detector)}:    {icon}{conf_str}\n")
         if watermarks.has_watermark:
-            lines.append("  Summary:      Watermark detected")
+            w("  Summary:      Watermark detected\n")
 
     # Video Info section
-    lines.append("")
-    lines.append("## VIDEO INFO")
+    w("\n")
+    w("## VIDEO INFO\n")
 
     tech = metadata.technical
 
     # Duration
-    lines.append(f"  Duration:     {tech.duration_formatted}")
+    w(f"  Duration:     {tech.duration_formatted}\n")
 
     # Resolution with aspect ratio
     video = tech.video
     if video.width and video.height:
         aspect = video.aspect_ratio
         if aspect:
-            lines.append(f"  Resolution:   {video.width}x{video.height} ({aspect})")
+            w(f"  Resolution:   {video.width}x{video.height} ({aspect})\n")
         else:
-            lines.append(f"  Resolution:   {video.width}x{video.height}")
+            w(f"  Resolution:   {video.width}x{video.height}\n")
 
     # Frame rate
     if video.fps:
-        lines.append(f"  Frame Rate:   {video.fps:.0f} fps")
+        w(f"  Frame Rate:   {video.fps:.0f} fps\n")
 
     # Size
-    lines.append(f"  Size:         {metadata.file_info.size_human}")
+    w(f"  Size:         {metadata.file_info.size_human}\n")
 
     # Bitrate
     if tech.bitrate:
         mbps = tech.bitrate / 1_000_000
-        lines.append(f"  Bitrate:      {mbps:.1f} Mbps")
+        w(f"  Bitrate:      {mbps:.1f} Mbps\n")
 
     # Audio (important: 96kHz is Sora signature, others use 48kHz)
     audio = tech.audio
@@ -187,49 +219,47 @@ def format_default(metadata: VideoMetadata) -> str:
             channel_info = audio.channel_layout
         elif audio.channels:
             channel_info = f"{audio.channels}ch"
-        lines.append(f"  Audio:        {khz:.0f}kHz {channel_info}".rstrip())
+        if channel_info:
+            w(f"  Audio:        {khz:.0f}kHz {channel_info}\n")
+        else:
+            w(f"  Audio:        {khz:.0f}kHz\n")
 
     # C2PA Validation section (if C2PA detected)
     if c2pa.has_c2pa:
-        lines.append("")
-        lines.append("## C2PA VALIDATION")
-        lines.append(f"  Status:       {c2pa.validation_state or 'Unknown'}")
+        w("\n")
+        w("## C2PA VALIDATION\n")
+        w(f"  Status:       {c2pa.validation_state or 'Unknown'}\n")
 
         # Trust status
-        if c2pa.cert_trusted is not None:
-            trust_icon = "✓" if c2pa.cert_trusted else "✗"
-            trust_text = (
-                "Certificate chain verified" if c2pa.cert_trusted else "Certificate NOT trusted"
-            )
-            lines.append(f"  Trusted:      {trust_icon} {trust_text}")
+        cert_trusted = c2pa.cert_trusted
+        if cert_trusted is not None:
+            trust_icon = "✓" if cert_trusted else "✗"
+            trust_text = "Certificate chain verified" if cert_trusted else "Certificate NOT trusted"
+            w(f"  Trusted:      {trust_icon} {trust_text}\n")
 
         if c2pa.manifest_id:
-            lines.append(f"  Manifest ID:  {c2pa.manifest_id}")
+            w(f"  Manifest ID:  {c2pa.manifest_id}\n")
 
         # SDK version
         if c2pa.claim_generator_version:
             sdk_str = c2pa.claim_generator_product or "c2pa"
-            lines.append(f"  SDK:          {sdk_str} {c2pa.claim_generator_version}")
+            w(f"  SDK:          {sdk_str} {c2pa.claim_generator_version}\n")
 
         # Signature algorithm
         if c2pa.signature_algorithm:
             alg = c2pa.signature_algorithm.upper()  # Normalize to uppercase
-            # Map common algorithm names
-            alg_names = {
-                "ES256": "ECDSA P-256",
-                "ES384": "ECDSA P-384",
-                "ES512": "ECDSA P-521",
-                "PS256": "RSA-PSS SHA-256",
-                "PS384": "RSA-PSS SHA-384",
-                "PS512": "RSA-PSS SHA-512",
-            }
-            alg_desc = alg_names.get(alg, "")
+            alg_desc = _SIG_ALG_NAMES.get(alg, "")
             if alg_desc:
-                lines.append(f"  Signature:    {alg} ({alg_desc})")
+                w(f"  Signature:    {alg} ({alg_desc})\n")
             else:
-                lines.append(f"  Signature:    {alg}")
+                w(f"  Signature:    {alg}\n")
 
-    lines.append("")
-    lines.append("=" * 70)
+    w("\n")
+    w(_BANNER)
 
-    return "\n".join(lines)
+
+def format_default(metadata: VideoMetadata) -> str:
+    """Format metadata as concise default output (see ``write_default``)."""
+    buf = io.StringIO()
+    write_default(metadata, buf.write)
+    return buf.getvalue()
@@ -1,451 +1,457 @@
 """Full output formatter - comprehensive metadata dump."""
 
+import functools
+import io
+from collections.abc import Callable
+from itertools import islice
+from operator import attrgetter, methodcaller
 from typing import Any
 
 from aivid.models import VideoMetadata
 
-
-def _format_dict(d: dict[str, Any], indent: int = 2) -> list[str]:
-    """Format a dictionary as indented lines."""
-    lines = []
-    prefix = " " * indent
-    for key, value in d.items():
-        if value is None or value == "" or value == [] or value == {}:
-            continue
-        if isinstance(value, dict):
-            lines.append(f"{prefix}{key}:")
-            lines.extend(_format_dict(value, indent + 2))
-        elif isinstance(value, list):
-            if value and isinstance(value[0], dict):
-                lines.append(f"{prefix}{key}: [{len(value)} items]")
-            else:
-                lines.append(f"{prefix}{key}: {value}")
-        else:
-            lines.append(f"{prefix}{key}: {value}")
-    return lines
+_BANNER = "=" * 70
+
+# Sample rates that are not worth a note in the audio section
+_COMMON_SAMPLE_RATES = frozenset({44100, 48000, 22050, 11025, 8000, 16000})
+
+# TikTok Research API video_tag.number meanings
+_TIKTOK_TAG_MEANING = {1: "Creator labeled", 2: "Auto-detected"}
+
+# Signal status icons, indexed by AISignal.detected
+_SIGNAL_ICONS = ("✗", "✓")
+
+# Watermark detector section labels ("audioseal" -> "AUDIOSEAL"), reused across files
+_detector_label = functools.cache(str.upper)
+
+_isoformat = methodcaller("isoformat")
+_thousands = "{:,}".format
+
+
+def _preview(text: str) -> str:
+    """Truncate long descriptions to 200 characters."""
+    return text[:200] + "..." if len(text) > 200 else text
+
+
+# Optional fields per section: (attribute, label, formatter or None). Falsy
+# values are skipped; the formatter is only applied to values that are shown.
+_FILE_TIME_FIELDS = (
+    ("created", "created", _isoformat),
+    ("modified", "modified", _isoformat),
+    ("accessed", "accessed", _isoformat),
+)
+
+_SOURCE_FIELDS = (
+    ("platform", "platform", attrgetter("value")),
+    ("original_url", "original_url", None),
+    ("video_id", "video_id", None),
+    ("downloaded_path", "downloaded_path", None),
+    ("download_timestamp", "download_timestamp", _isoformat),
+    ("uploader", "uploader", None),
+    ("uploader_id", "uploader_id", None),
+    ("upload_date", "upload_date", _isoformat),
+    ("title", "title", None),
+    ("description", "description", _preview),
+    ("duration_seconds", "duration_seconds", None),
+    ("view_count", "view_count", _thousands),
+    ("like_count", "like_count", _thousands),
+    ("comment_count", "comment_count", _thousands),
+)
+
+_TECHNICAL_FIELDS = (
+    ("container", "container", None),
+    ("container_long", "container_long", None),
+    ("duration", "duration", "{:.6f}s".format),
+    ("bitrate", "bitrate", None),
+    ("nb_streams", "nb_streams", None),
+)
+
+_VIDEO_FIELDS = (
+    ("codec_long", "codec_long", None),
+    ("profile", "profile", None),
+    ("resolution", "resolution", None),
+    ("fps", "fps", None),
+    ("bitrate", "bitrate", None),
+    ("pixel_format", "pixel_format", None),
+    ("encoder", "encoder", None),
+    ("handler", "handler", None),
+)
+
+# Audio fields before and after sample_rate, which has a note attached
+_AUDIO_HEAD_FIELDS = (
+    ("codec_long", "codec_long", None),
+    ("profile", "profile", None),
+)
+
+_AUDIO_TAIL_FIELDS = (
+    ("channels", "channels", None),
+    ("channel_layout", "channel_layout", None),
+    ("bitrate", "bitrate", None),
+)
+
+_WATERMARK_FIELDS = (
+    ("watermark_type", "watermark_type", None),
+    ("message_bits", "message_bits", None),
+    ("message_decoded", "message_decoded", None),
+    ("frames_analyzed", "frames_analyzed", None),
+)
+
+_C2PA_FIELDS = (
+    ("manifest_id", "manifest_id", None),
+    ("title", "title", None),
+    ("task_id", "task_id", None),
+    ("instance_id", "instance_id", None),
+    ("claim_generator", "claim_generator", None),
+    ("software_agent", "software_agent", None),
+    ("claim_generator_version", "c2pa_sdk_version", None),
+    ("issuer", "issuer", None),
+    ("signer_name", "signer_name", None),
+    ("signature_time", "signature_time", _isoformat),
+    ("signature_algorithm", "signature_algorithm", None),
+    ("digital_source_type", "digital_source_type", None),
+    ("validation_state", "validation_state", None),
+)
+
+_AI_GENERATOR_FIELDS = (
+    ("generator", "generator", None),
+    ("generator_raw", "generator_raw", None),
+)
+
+_DESCRIPTIVE_FIELDS = (
+    ("title", "title", None),
+    ("creator", "creator", None),
+    ("description", "description", None),
+    ("software", "software", None),
+    ("copyright", "copyright", None),
+)
+
+_IPTC_AI_FIELDS = (
+    ("ai_system_used", "ai_system_used", None),
+    ("ai_system_version", "ai_system_version", None),
+    ("ai_prompt_info", "ai_prompt_info", None),
+    ("ai_prompt_writer_name", "ai_prompt_writer_name", None),
+    ("ai_training_mining_usage", "ai_training_mining_usage", None),
+)
+
+# Indentation prefixes for the box tree, indexed by width
+_INDENTS = tuple(" " * i for i in range(20))
+
+
+def _emit_fields(
+    w: Callable[[str], object],
+    obj: object,
+    fields: tuple[tuple[str, str, Callable[[Any], object] | None], ...],
+    prefix: str = "  ",
+) -> None:
+    """Write ``label: value`` lines for the fields of ``obj`` that have a value.
+
+    Args:
+        w: Write function (e.g. ``io.StringIO.write``)
+        obj: Model whose attributes are written
+        fields: Field table in output order (see ``_SOURCE_FIELDS``)
+        prefix: Indentation before each label
+    """
+    for attr, label, fmt in fields:
+        value = getattr(obj, attr)
+        if value:
+            w(f"{prefix}{label}: {value if fmt is None else fmt(value)}\n")
 
 
-def format_full(metadata: VideoMetadata) -> str:
-    """Format metadata as comprehensive full output.
+def write_full(metadata: VideoMetadata, w: Callable[[str], object]) -> None:
+    """Write metadata as comprehensive full output.
 
     Includes all available metadata from all extractors.
+
+    Args:
+        metadata: Metadata to format
+        w: Write function (e.g. ``sys.stdout.write``); the output has no
+            trailing newline
     """
-    lines = []
 
-    lines.append("=" * 70)
-    lines.append("MEDIA METADATA REPORT (FULL)")
-    lines.append("=" * 70)
-    lines.append("")
+    w(_BANNER + "\n")
+    w("MEDIA METADATA REPORT (FULL)\n")
+    w(_BANNER + "\n")
+    w("\n")
 
     # File Info
-    lines.append("## FILE INFORMATION")
+    w("## FILE INFORMATION\n")
     fi = metadata.file_info
-    lines.append(f"  filename: {fi.filename}")
-    lines.append(f"  path: {fi.path}")
-    lines.append(f"  size_bytes: {fi.size_bytes}")
-    lines.append(f"  size_human: {fi.size_human}")
-    if fi.created:
-        lines.append(f"  created: {fi.created.isoformat()}")
-    if fi.modified:
-        lines.append(f"  modified: {fi.modified.isoformat()}")
-    if fi.accessed:
-        lines.append(f"  accessed: {fi.accessed.isoformat()}")
-    lines.append(f"  extension: {fi.extension}")
-    lines.append("")
+    w(f"  filename: {fi.filename}\n")
+    w(f"  path: {fi.path}\n")
+    w(f"  size_bytes: {fi.size_bytes}\n")
+    w(f"  size_human: {fi.size_human}\n")
+    _emit_fields(w, fi, _FILE_TIME_FIELDS)
+    w(f"  extension: {fi.extension}\n")
+    w("\n")
 
     # Source Info (if downloaded from URL)
     source = metadata.source
     if source.is_from_url:
-        lines.append("## SOURCE INFORMATION")
-        lines.append(f"  platform: {source.platform.value}")
-        if source.original_url:
-            lines.append(f"  original_url: {source.original_url}")
-        if source.video_id:
-            lines.append(f"  video_id: {source.video_id}")
-        if source.downloaded_path:
-            lines.append(f"  downloaded_path: {source.downloaded_path}")
-        if source.download_timestamp:
-            lines.append(f"  download_timestamp: {source.download_timestamp.isoformat()}")
-        if source.uploader:
-            lines.append(f"  uploader: {source.uploader}")
-        if source.uploader_id:
-            lines.append(f"  uploader_id: {source.uploader_id}")
-        if source.upload_date:
-            lines.append(f"  upload_date: {source.upload_date.isoformat()}")
-        if source.title:
-            lines.append(f"  title: {source.title}")
-        if source.description:
-            # Truncate long descriptions
-            desc_preview = source.description[:200]
-            if len(source.description) > 200:
-                desc_preview += "..."
-            lines.append(f"  description: {desc_preview}")
-        if source.duration_seconds:
-            lines.append(f"  duration_seconds: {source.duration_seconds}")
-        if source.view_count:
-            lines.append(f"  view_count: {source.view_count:,}")
-        if source.like_count:
-            lines.append(f"  like_count: {source.like_count:,}")
-        if source.comment_count:
-            lines.append(f"  comment_count: {source.comment_count:,}")
+        w("## SOURCE INFORMATION\n")
+        _emit_fields(w, source, _SOURCE_FIELDS)
         if source.tags:
-            lines.append(f"  tags: {', '.join(source.tags[:10])}")
+            w(f"  tags: {', '.join(islice(source.tags, 10))}\n")
             if len(source.tags) > 10:
-                lines.append(f"    ... and {len(source.tags) - 10} more tags")
+                w(f"    ... and {len(source.tags) - 10} more tags\n")
         if source.categories:
-            lines.append(f"  categories: {', '.join(source.categories)}")
-        lines.append("")
+            w(f"  categories: {', '.join(source.categories)}\n")
+        w("\n")
 
     # Technical Info
     tech = metadata.technical
-    lines.append("## TECHNICAL INFORMATION")
-    if tech.container:
-        lines.append(f"  container: {tech.container}")
-    if tech.container_long:
-        lines.append(f"  container_long: {tech.container_long}")
-    if tech.duration:
-        lines.append(f"  duration: {tech.duration:.6f}s")
-    if tech.bitrate:
-        lines.append(f"  bitrate: {tech.bitrate}")
-    if tech.nb_streams:
-        lines.append(f"  nb_streams: {tech.nb_streams}")
-    lines.append("")
+    w("## TECHNICAL INFORMATION\n")
+    _emit_fields(w, tech, _TECHNICAL_FIELDS)
+    w("\n")
 
     # Video Stream
     video = tech.video
     if video.codec:
-        lines.append("  [VIDEO]")
-        lines.append(f"    codec: {video.codec}")
-        if video.codec_long:
-            lines.append(f"    codec_long: {video.codec_long}")
-        if video.profile:
-            lines.append(f"    profile: {video.profile}")
-        if video.width and video.height:
-            lines.append(f"    resolution: {video.width}x{video.height}")
-        if video.fps:
-            lines.append(f"    fps: {video.fps}")
-        if video.bitrate:
-            lines.append(f"    bitrate: {video.bitrate}")
-        if video.pixel_format:
-            lines.append(f"    pixel_format: {video.pixel_format}")
-        if video.encoder:
-            lines.append(f"    encoder: {video.encoder}")
-        if video.handler:
-            lines.append(f"    handler: {video.handler}")
-        lines.append("")
+        w("  [VIDEO]\n")
+        w(f"    codec: {video.codec}\n")
+        _emit_fields(w, video, _VIDEO_FIELDS, "    ")
+        w("\n")
 
     # Audio Stream
     audio = tech.audio
     if audio.codec:
-        lines.append("  [AUDIO]")
-        lines.append(f"    codec: {audio.codec}")
-        if audio.codec_long:
-            lines.append(f"    codec_long: {audio.codec_long}")
-        if audio.profile:
-            lines.append(f"    profile: {audio.profile}")
+        w("  [AUDIO]\n")
+        w(f"    codec: {audio.codec}\n")
+        _emit_fields(w, audio, _AUDIO_HEAD_FIELDS, "    ")
         if audio.sample_rate:
-            lines.append(f"    sample_rate: {audio.sample_rate}")
+            w(f"    sample_rate: {audio.sample_rate}\n")
             # Note unusual sample rates that may indicate AI generation
             if audio.sample_rate == 96000:
-                lines.append("    sample_rate_note: Sora signature (typical: 48000)")
-            elif audio.sample_rate not in (44100, 48000, 22050, 11025, 8000, 16000):
-                lines.append("    sample_rate_note: Unusual rate (typical: 44100/48000)")
-        if audio.channels:
-            lines.append(f"    channels: {audio.channels}")
-        if audio.channel_layout:
-            lines.append(f"    channel_layout: {audio.channel_layout}")
-        if audio.bitrate:
-            lines.append(f"    bitrate: {audio.bitrate}")
-        lines.append("")
+                w("    sample_rate_note: Sora signature (typical: 48000)\n")
+            elif audio.sample_rate not in _COMMON_SAMPLE_RATES:
+                w("    sample_rate_note: Unusual rate (typical: 44100/48000)\n")
+        _emit_fields(w, audio, _AUDIO_TAIL_FIELDS, "    ")
+        w("\n")
 
     # C2PA / Provenance
-    c2pa = metadata.provenance.c2pa
+    prov = metadata.provenance
+    c2pa = prov.c2pa
     if c2pa.has_c2pa:
-        lines.append("## C2PA / PROVENANCE")
-        lines.append(f"  has_c2pa: {c2pa.has_c2pa}")
-        lines.append(f"  source: {c2pa.source}")
-        if c2pa.manifest_id:
-            lines.append(f"  manifest_id: {c2pa.manifest_id}")
-        if c2pa.title:
-            lines.append(f"  title: {c2pa.title}")
-        if c2pa.task_id:
-            lines.append(f"  task_id: {c2pa.task_id}")
-        if c2pa.instance_id:
-            lines.append(f"  instance_id: {c2pa.instance_id}")
-        if c2pa.claim_generator:
-            lines.append(f"  claim_generator: {c2pa.claim_generator}")
-        if c2pa.software_agent:
-            lines.append(f"  software_agent: {c2pa.software_agent}")
-        if c2pa.claim_generator_version:
-            lines.append(f"  c2pa_sdk_version: {c2pa.claim_generator_version}")
-        if c2pa.issuer:
-            lines.append(f"  issuer: {c2pa.issuer}")
-        if c2pa.signer_name:
-            lines.append(f"  signer_name: {c2pa.signer_name}")
-        if c2pa.signature_time:
-            lines.append(f"  signature_time: {c2pa.signature_time.isoformat()}")
-        if c2pa.signature_algorithm:
-            lines.append(f"  signature_algorithm: {c2pa.signature_algorithm}")
-        if c2pa.digital_source_type:
-            lines.append(f"  digital_source_type: {c2pa.digital_source_type}")
-        if c2pa.validation_state:
-            lines.append(f"  validation_state: {c2pa.validation_state}")
+        w("## C2PA / PROVENANCE\n")
+        w(f"  has_c2pa: {c2pa.has_c2pa}\n")
+        w(f"  source: {c2pa.source}\n")
+        _emit_fields(w, c2pa, _C2PA_FIELDS)
         # cert_trusted: show explicitly even if False
         if c2pa.cert_trusted is not None:
-            lines.append(f"  cert_trusted: {c2pa.cert_trusted}")
+            w(f"  cert_trusted: {c2pa.cert_trusted}\n")
         if c2pa.actions:
-            lines.append(f"  actions: {len(c2pa.actions)} action(s)")
+            w(f"  actions: {len(c2pa.actions)} action(s)\n")
             for action in c2pa.actions:
                 action_info = f"    - {action.action}"
                 if action.when:
                     action_info += f" (when: {action.when.isoformat()})"
-                lines.append(action_info)
+                w(action_info + "\n")
         # Ingredients: show explicitly even if None
-        if c2pa.ingredient_count > 0:
-            lines.append(f"  ingredients: {c2pa.ingredient_count} ingredient(s)")
-            for ing in c2pa.ingredients[:5]:  # Limit to first 5
+        ingredient_count = c2pa.ingredient_count
+        if ingredient_count > 0:
+            w(f"  ingredients: {ingredient_count} ingredient(s)\n")
+            for ing in islice(c2pa.ingredients, 5):  # Limit to first 5
                 ing_title = ing.get("title", "unknown")
                 ing_format = ing.get("format", "")
-                lines.append(f"    - {ing_title} ({ing_format})")
-            if c2pa.ingredient_count > 5:
-                lines.append(f"    ... and {c2pa.ingredient_count - 5} more")
+                w(f"    - {ing_title} ({ing_format})\n")
+            if ingredient_count > 5:
+                w(f"    ... and {ingredient_count - 5} more\n")
         else:
-            lines.append("  ingredients: None")
+            w("  ingredients: None\n")
         if c2pa.generation_mode:
-            lines.append(f"  generation_mode: {c2pa.generation_mode} [ANALYSIS]")
-        lines.append("")
+            w(f"  generation_mode: {c2pa.generation_mode} [ANALYSIS]\n")
+        w("\n")
 
         # Validation details subsection
-        has_validation_details = any(
-            [
-                c2pa.timestamp_validated is not None,
-                c2pa.timestamp_responder,
-                c2pa.claim_signature_valid is not None,
-                c2pa.cert_chain,
-                c2pa.validation_errors,
-            ]
+        ts_validated, ts_responder, sig_valid, cert_chain, errors = (
+            c2pa.timestamp_validated,
+            c2pa.timestamp_responder,
+            c2pa.claim_signature_valid,
+            c2pa.cert_chain,
+            c2pa.validation_errors,
+        )
+        has_validation_details = (
+            ts_validated is not None
+            or ts_responder
+            or sig_valid is not None
+            or cert_chain
+            or errors
         )
         if has_validation_details:
-            lines.append("  [VALIDATION DETAILS]")
-            if c2pa.timestamp_validated is not None:
-                lines.append(f"    timestamp_validated: {c2pa.timestamp_validated}")
-            if c2pa.timestamp_responder:
-                lines.append(f"    timestamp_responder: {c2pa.timestamp_responder}")
-            if c2pa.claim_signature_valid is not None:
-                lines.append(f"    claim_signature_valid: {c2pa.claim_signature_valid}")
-            if c2pa.cert_chain:
-                lines.append(f"    cert_chain: {c2pa.cert_chain}")
-            if c2pa.validation_errors:
-                lines.append("    warnings:")
-                for err in c2pa.validation_errors:
+            w("  [VALIDATION DETAILS]\n")
+            if ts_validated is not None:
+                w(f"    timestamp_validated: {ts_validated}\n")
+            if ts_responder:
+                w(f"    timestamp_responder: {ts_responder}\n")
+            if sig_valid is not None:
+                w(f"    claim_signature_valid: {sig_valid}\n")
+            if cert_chain:
+                w(f"    cert_chain: {cert_chain}\n")
+            if errors:
+                w("    warnings:\n")
+                for err in errors:
                     if err:
-                        lines.append(f"      - {err}")
-            lines.append("")
+                        w(f"      - {err}\n")
+            w("\n")
 
     # AI Detection
     ai = metadata.ai_detection
     if ai.is_ai_generated or ai.signals:
-        lines.append("## AI DETECTION")
-        lines.append(f"  is_ai_generated: {ai.is_ai_generated}")
-        if ai.generator:
-            lines.append(f"  generator: {ai.generator}")
-        if ai.generator_raw:
-            lines.append(f"  generator_raw: {ai.generator_raw}")
+        w("## AI DETECTION\n")
+        w(f"  is_ai_generated: {ai.is_ai_generated}\n")
+        _emit_fields(w, ai, _AI_GENERATOR_FIELDS)
         # Show inferred model for generators with multiple models (e.g., Sora)
         if ai.inferred_model or ai.model_confidence:
             if ai.inferred_model:
-                lines.append(
-                    f"  inferred_model: {ai.inferred_model} ({ai.model_confidence}) [ANALYSIS]"
-                )
+                w(f"  inferred_model: {ai.inferred_model} ({ai.model_confidence}) [ANALYSIS]\n")
             else:
                 # No model could be inferred
-                res = metadata.technical.video.resolution or "unknown"
+                res = video.resolution or "unknown"
                 if ai.model_confidence == "ambiguous":
-                    lines.append(f"  inferred_model: sora-2 or sora-2-pro ({res}) [ANALYSIS]")
+                    w(f"  inferred_model: sora-2 or sora-2-pro ({res}) [ANALYSIS]\n")
                 else:
-                    lines.append(f"  inferred_model: unknown ({res}) [ANALYSIS]")
-        lines.append(f"  confidence: {ai.confidence:.2f}")
+                    w(f"  inferred_model: unknown ({res}) [ANALYSIS]\n")
+        w(f"  confidence: {ai.confidence:.2f}\n")
         if ai.signing_authorities:
-            lines.append(f"  signing_authorities: {', '.join(ai.signing_authorities)}")
+            w(f"  signing_authorities: {', '.join(ai.signing_authorities)}\n")
         if ai.signals:
             # Separate facts from analysis
             facts = {k: v for k, v in ai.signals.items() if v.is_fact}
             analysis = {k: v for k, v in ai.signals.items() if not v.is_fact}
 
             if facts:
-                lines.append("  signals [FACT - from metadata]:")
+                w("  signals [FACT - from metadata]:\n")
                 for name, signal in facts.items():
-                    icon = "✓" if signal.detected else "✗"
-                    lines.append(f"    {icon} {name}: {signal.description or ''}")
+                    w(f"    {_SIGNAL_ICONS[signal.detected]} {name}: {signal.description or ''}\n")
             if analysis:
-                lines.append("  signals [ANALYSIS - inferred]:")
+                w("  signals [ANALYSIS - inferred]:\n")
                 for name, signal in analysis.items():
-                    icon = "✓" if signal.detected else "✗"
-                    lines.append(f"    {icon} {name}: {signal.description or ''}")
-        lines.append("")
+                    w(f"    {_SIGNAL_ICONS[signal.detected]} {name}: {signal.description or ''}\n")
+        w("\n")
 
     # Platform API Labels (YouTube/TikTok API results)
-    platform_aigc = metadata.provenance.platform_aigc
-    has_platform_api = any(
-        [
-            platform_aigc.youtube_contains_synthetic_media is not None,
-            platform_aigc.tiktok_api_video_tag_type is not None,
-        ]
-    )
-    if has_platform_api:
-        lines.append("## PLATFORM API LABELS")
+    platform_aigc = prov.platform_aigc
+    yt_synthetic = platform_aigc.youtube_contains_synthetic_media
+    tt_tag_type = platform_aigc.tiktok_api_video_tag_type
+    if yt_synthetic is not None or tt_tag_type is not None:
+        w("## PLATFORM API LABELS\n")
 
         # YouTube API
-        if platform_aigc.youtube_contains_synthetic_media is not None:
-            lines.append("  [YOUTUBE DATA API v3]")
+        if yt_synthetic is not None:
+            w("  [YOUTUBE DATA API v3]\n")
             if platform_aigc.youtube_video_id:
-                lines.append(f"    video_id: {platform_aigc.youtube_video_id}")
-            lines.append(
-                f"    contains_synthetic_media: {platform_aigc.youtube_contains_synthetic_media}"
-            )
-            if platform_aigc.youtube_contains_synthetic_media:
-                lines.append("    interpretation: Video contains AI-generated content")
+                w(f"    video_id: {platform_aigc.youtube_video_id}\n")
+            w(f"    contains_synthetic_media: {yt_synthetic}\n")
+            if yt_synthetic:
+                w("    interpretation: Video contains AI-generated content\n")
             else:
-                lines.append("    interpretation: No AI label from YouTube")
+                w("    interpretation: No AI label from YouTube\n")
 
         # TikTok Research API
-        if platform_aigc.tiktok_api_video_tag_type is not None:
-            lines.append("  [TIKTOK RESEARCH API]")
-            if platform_aigc.tiktok_api_video_tag_number is not None:
-                tag_meaning = {
-                    1: "Creator labeled",
-                    2: "Auto-detected",
-                }.get(platform_aigc.tiktok_api_video_tag_number, "Unknown")
-                lines.append(
-                    f"    video_tag_number: {platform_aigc.tiktok_api_video_tag_number} ({tag_meaning})"
-                )
-            lines.append(f"    video_tag_type: {platform_aigc.tiktok_api_video_tag_type}")
+        if tt_tag_type is not None:
+            w("  [TIKTOK RESEARCH API]\n")
+            tag_number = platform_aigc.tiktok_api_video_tag_number
+            if tag_number is not None:
+                tag_meaning = _TIKTOK_TAG_MEANING.get(tag_number, "Unknown")
+                w(f"    video_tag_number: {tag_number} ({tag_meaning})\n")
+            w(f"    video_tag_type: {tt_tag_type}\n")
             if platform_aigc.is_tiktok_api_ai_labeled:
-                lines.append("    interpretation: TikTok flagged as AI-generated")
+                w("    interpretation: TikTok flagged as AI-generated\n")
 
-        lines.append("")
+        w("\n")
 
     # Watermark Detection
-    watermarks = metadata.provenance.watermarks
+    watermarks = prov.watermarks
     if watermarks.detections:
-        lines.append("## WATERMARK DETECTION")
-        lines.append(f"  has_watermark: {watermarks.has_watermark}")
-        lines.append(f"  overall_confidence: {watermarks.overall_confidence:.2f}")
-        lines.append(f"  detectors_run: {len(watermarks.detections)}")
-        lines.append("")
+        w("## WATERMARK DETECTION\n")
+        w(f"  has_watermark: {watermarks.has_watermark}\n")
+        w(f"  overall_confidence: {watermarks.overall_confidence:.2f}\n")
+        w(f"  detectors_run: {len(watermarks.detections)}\n")
+        w("\n")
 
         for detection in watermarks.detections:
-            lines.append(f"  [{detection.detector.upper()}]")
-            lines.append(f"    detected: {detection.detected}")
-            lines.append(f"    confidence: {detection.confidence:.4f}")
-            if detection.watermark_type:
-                lines.append(f"    watermark_type: {detection.watermark_type}")
-            if detection.message_bits:
-                lines.append(f"    message_bits: {detection.message_bits}")
-            if detection.message_decoded:
-                lines.append(f"    message_decoded: {detection.message_decoded}")
-            if detection.frames_analyzed:
-                lines.append(f"    frames_analyzed: {detection.frames_analyzed}")
+            w(f"  [{_detector_label(detection.detector)}]\n")
+            w(f"    detected: {detection.detected}\n")
+            w(f"    confidence: {detection.confidence:.4f}\n")
+            _emit_fields(w, detection, _WATERMARK_FIELDS, "    ")
             if detection.positive_frames is not None:
-                lines.append(f"    positive_frames: {detection.positive_frames}")
+                w(f"    positive_frames: {detection.positive_frames}\n")
             if detection.detection_threshold is not None:
-                lines.append(f"    detection_threshold: {detection.detection_threshold}")
+                w(f"    detection_threshold: {detection.detection_threshold}\n")
 
-        lines.append("")
+        w("\n")
 
     # Descriptive Metadata
     desc = metadata.descriptive
-    has_desc = any(
-        [
-            desc.title,
-            desc.creator,
-            desc.description,
-            desc.software,
-            desc.creation_timestamp.value,
-        ]
+    has_desc = (
+        desc.title
+        or desc.creator
+        or desc.description
+        or desc.software
+        or desc.creation_timestamp.value
     )
     if has_desc:
-        lines.append("## DESCRIPTIVE METADATA")
-        if desc.title:
-            lines.append(f"  title: {desc.title}")
-        if desc.creator:
-            lines.append(f"  creator: {desc.creator}")
-        if desc.description:
-            lines.append(f"  description: {desc.description}")
-        if desc.software:
-            lines.append(f"  software: {desc.software}")
-        if desc.copyright:
-            lines.append(f"  copyright: {desc.copyright}")
-        lines.append("")
+        w("## DESCRIPTIVE METADATA\n")
+        _emit_fields(w, desc, _DESCRIPTIVE_FIELDS)
+        w("\n")
 
         # Timestamp tracking with source attribution
-        lines.append("  [TIMESTAMPS]")
+        w("  [TIMESTAMPS]\n")
         creation_ts = desc.creation_timestamp
         if creation_ts.value is not None:
-            lines.append(f"    creation_time: {creation_ts.value.isoformat()}")
-            lines.append(f"    creation_source: {creation_ts.source}")
+            w(f"    creation_time: {creation_ts.value.isoformat()}\n")
+            w(f"    creation_source: {creation_ts.source}\n")
             if creation_ts.raw_value:
-                lines.append(f"    creation_raw: {creation_ts.raw_value}")
+                w(f"    creation_raw: {creation_ts.raw_value}\n")
         modification_ts = desc.modification_timestamp
         if modification_ts.value is not None:
-            lines.append(f"    modification_time: {modification_ts.value.isoformat()}")
-            lines.append(f"    modification_source: {modification_ts.source}")
-        lines.append("")
+            w(f"    modification_time: {modification_ts.value.isoformat()}\n")
+            w(f"    modification_source: {modification_ts.source}\n")
+        w("\n")
 
     # IPTC AI Metadata (2025.1)
     iptc_ai = desc.iptc_ai
-    has_iptc_ai = any(
-        [
-            iptc_ai.ai_system_used,
-            iptc_ai.ai_generated,
-            iptc_ai.ai_prompt_info,
-        ]
-    )
+    has_iptc_ai = iptc_ai.ai_system_used or iptc_ai.ai_generated or iptc_ai.ai_prompt_info
     if has_iptc_ai:
-        lines.append("## IPTC AI METADATA (2025.1)")
+        w("## IPTC AI METADATA (2025.1)\n")
         if iptc_ai.ai_generated is not None:
-            lines.append(f"  ai_generated: {iptc_ai.ai_generated}")
-        if iptc_ai.ai_system_used:
-            lines.append(f"  ai_system_used: {iptc_ai.ai_system_used}")
-        if iptc_ai.ai_system_version:
-            lines.append(f"  ai_system_version: {iptc_ai.ai_system_version}")
-        if iptc_ai.ai_prompt_info:
-            lines.append(f"  ai_prompt_info: {iptc_ai.ai_prompt_info}")
-        if iptc_ai.ai_prompt_writer_name:
-            lines.append(f"  ai_prompt_writer_name: {iptc_ai.ai_prompt_writer_name}")
-        if iptc_ai.ai_training_mining_usage:
-            lines.append(f"  ai_training_mining_usage: {iptc_ai.ai_training_mining_usage}")
-        lines.append("")
+            w(f"  ai_generated: {iptc_ai.ai_generated}\n")
+        _emit_fields(w, iptc_ai, _IPTC_AI_FIELDS)
+        w("\n")
 
     # Raw Data
     raw = metadata.raw
 
     # Box structure
     if raw.box_structure:
-        lines.append("## MP4 BOX STRUCTURE")
-        for box in raw.box_structure[:50]:
-            indent = "  " * box.depth
-            lines.append(f"  {indent}{box.type:8s} size={box.size:>12,}  offset={box.offset}")
+        w("## MP4 BOX STRUCTURE\n")
+        for box in islice(raw.box_structure, 50):
+            width = 2 * box.depth
+            indent = _INDENTS[width] if width < len(_INDENTS) else " " * width
+            w(f"  {indent}{box.type:8s} size={box.size:>12,}  offset={box.offset}\n")
         if len(raw.box_structure) > 50:
-            lines.append(f"  ... and {len(raw.box_structure) - 50} more boxes")
-        lines.append("")
+            w(f"  ... and {len(raw.box_structure) - 50} more boxes\n")
+        w("\n")
 
     # Format tags
     if raw.format_tags:
-        lines.append("## FORMAT TAGS")
+        w("## FORMAT TAGS\n")
         for key, value in raw.format_tags.items():
-            lines.append(f"  {key}: {value}")
-        lines.append("")
+            w(f"  {key}: {value}\n")
+        w("\n")
 
     # Interesting strings
     if raw.strings:
-        lines.append("## INTERESTING STRINGS")
-        for s in raw.strings[:30]:
-            lines.append(f"  {s[:150]}")
+        w("## INTERESTING STRINGS\n")
+        for s in islice(raw.strings, 30):
+            w(f"  {s[:150]}\n")
         if len(raw.strings) > 30:
-            lines.append(f"  ... and {len(raw.strings) - 30} more")
-        lines.append("")
+            w(f"  ... and {len(raw.strings) - 30} more\n")
+        w("\n")
 
-    lines.append("=" * 70)
+    w(_BANNER)
 
-    return "\n".join(lines)
+
+def format_full(metadata: VideoMetadata) -> str:
+    """Format metadata as comprehensive full output (see ``write_full``)."""
+    buf = io.StringIO()
+    write_full(metadata, buf.write)
+    return buf.getvalue()
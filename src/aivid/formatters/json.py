@@ -1,10 +1,14 @@
 """JSON output formatter."""
 
-import json
 from typing import Any
 
+from pydantic import TypeAdapter
+
 from aivid.models import VideoMetadata
 
+# Serializes a whole list in pydantic-core without building per-file dicts
+_METADATA_LIST = TypeAdapter(list[VideoMetadata])
+
 
 def format_json(metadata: VideoMetadata, indent: int = 2) -> str:
     """Format metadata as JSON string.
@@ -22,6 +26,9 @@ def format_json(metadata: VideoMetadata, indent: int = 2) -> str:
 def format_json_list(metadata_list: list[VideoMetadata], indent: int = 2) -> str:
     """Format multiple metadata objects as JSON array.
 
+    Matches :func:`format_json`: NaN and infinite floats are written as
+    ``null``, and ``indent=None`` gives compact output with no spaces.
+
     Args:
         metadata_list: List of VideoMetadata objects
         indent: JSON indentation level
@@ -29,8 +36,7 @@ def format_json_list(metadata_list: list[VideoMetadata], indent: int = 2) -> str
     Returns:
         JSON array formatted string
     """
-    data = [m.model_dump(mode="json") for m in metadata_list]
-    return json.dumps(data, indent=indent, ensure_ascii=False, default=str)
+    return _METADATA_LIST.dump_json(metadata_list, indent=indent).decode()
 
 
 def to_dict(metadata: VideoMetadata) -> dict[str, Any]:
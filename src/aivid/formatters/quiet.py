@@ -1,5 +1,7 @@
 """Quiet output formatter - one-line summary."""
 
+from collections.abc import Callable, Iterable
+
 from aivid.models import VideoMetadata
 
 
@@ -52,3 +54,17 @@ def format_quiet_list(metadata_list: list[VideoMetadata]) -> str:
         Multiple lines, one per file
     """
     return "\n".join(format_quiet(m) for m in metadata_list)
+
+
+def write_quiet_list(metadata_list: Iterable[VideoMetadata], w: Callable[[str], object]) -> None:
+    """Write one-line summaries for multiple files, one line at a time.
+
+    Unlike ``format_quiet_list`` this never holds the whole listing in
+    memory, and each line ends with a newline.
+
+    Args:
+        metadata_list: VideoMetadata objects
+        w: Write function (e.g. ``sys.stdout.write``)
+    """
+    for m in metadata_list:
+        w(format_quiet(m) + "\n")
@@ -1,5 +1,7 @@
 """AI detection result models."""
 
+import re
+
 from pydantic import BaseModel, Field
 
 # AI Generator mappings
@@ -19,22 +21,53 @@ AI_GENERATORS = {
     "Veo": "Google Veo",
 }
 
+# Single scan for all generator keys, run over the lowercased name (faster than
+# re.IGNORECASE). The lookahead reports a match at every position, so
+# overlapping keys are all seen.
+_GENERATOR_KEYS = tuple(AI_GENERATORS)
+_GENERATOR_RANKS = {key.lower(): rank for rank, key in enumerate(_GENERATOR_KEYS)}
+_GENERATOR_PATTERN = re.compile("(?=(" + "|".join(map(re.escape, _GENERATOR_RANKS)) + "))")
+
+
+def match_ai_generator(name: str) -> str | None:
+    """Identify an AI generator from a claim generator or software agent name.
+
+    Args:
+        name: Generator name (e.g., "OpenAI Sora", "Adobe Firefly 3")
+
+    Returns:
+        Normalized generator name for the first AI_GENERATORS key (in dict
+        order) contained in ``name``, case-insensitively, or None
+    """
+    ranks = [_GENERATOR_RANKS[m.group(1)] for m in _GENERATOR_PATTERN.finditer(name.lower())]
+    if not ranks:
+        return None
+    return AI_GENERATORS[_GENERATOR_KEYS[min(ranks)]]
+
+
 # Signing authority mappings
 SIGNING_AUTHORITIES = ["OpenAI", "Adobe", "Microsoft", "Google", "Meta", "Apple"]
 
+# Lowercased lookup table for case-insensitive substring matching
+SIGNING_AUTHORITIES_LOWER = tuple((auth.lower(), auth) for auth in SIGNING_AUTHORITIES)
+
 # Sora model resolution mappings (based on OpenAI API pricing)
 # sora-2: 720x1280 only ($0.10/s)
 # sora-2-pro: 720x1280 ($0.30/s) or 1024x1792 ($0.50/s)
-SORA_PRO_EXCLUSIVE_RESOLUTIONS = [
-    (1024, 1792),  # Portrait
-    (1792, 1024),  # Landscape
-]
-SORA_SHARED_RESOLUTIONS = [
-    (720, 1280),  # Portrait API standard
-    (1280, 720),  # Landscape API standard
-    (704, 1280),  # Portrait - Sora web download (compressed)
-    (1280, 704),  # Landscape - Sora web download (compressed)
-]
+SORA_PRO_EXCLUSIVE_RESOLUTIONS = frozenset(
+    {
+        (1024, 1792),  # Portrait
+        (1792, 1024),  # Landscape
+    }
+)
+SORA_SHARED_RESOLUTIONS = frozenset(
+    {
+        (720, 1280),  # Portrait API standard
+        (1280, 720),  # Landscape API standard
+        (704, 1280),  # Portrait - Sora web download (compressed)
+        (1280, 704),  # Landscape - Sora web download (compressed)
+    }
+)
 
 
 def infer_sora_model(width: int, height: int) -> tuple[str | None, str]:
@@ -124,16 +157,16 @@ class AIDetectionResult(BaseModel):
         # Identify generator
         if claim_generator:
             result.generator_raw = claim_generator
-            for key, value in AI_GENERATORS.items():
-                if key.lower() in claim_generator.lower():
-                    result.generator = value
-                    result.is_ai_generated = True
-                    break
+            generator = match_ai_generator(claim_generator)
+            if generator:
+                result.generator = generator
+                result.is_ai_generated = True
 
         # Detect signing authority
         if issuer:
-            for auth in SIGNING_AUTHORITIES:
-                if auth.lower() in issuer.lower():
+            issuer_lower = issuer.lower()
+            for auth_lower, auth in SIGNING_AUTHORITIES_LOWER:
+                if auth_lower in issuer_lower:
                     result.signing_authorities.append(auth)
 
         # Check 96kHz audio (Sora signature) - this is analysis, not direct AI declaration
@@ -168,6 +201,10 @@ class AIDetectionResult(BaseModel):
     ) -> None:
         """Add a detection signal.
 
+        A detected signal raises the overall confidence to its own confidence.
+        The overall confidence is never lowered, so replacing a signal with a
+        weaker one keeps the earlier value.
+
         Args:
             name: Signal identifier
             detected: Whether the signal was detected
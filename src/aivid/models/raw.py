@@ -45,5 +45,6 @@ class RawMetadata(BaseModel):
     # Chapters
     chapters: list[dict[str, Any]] = Field(default_factory=list)
 
-    # Programs (for transport streams)
+    # Programs (for transport streams). Kept for the JSON schema; always empty
+    # since ffprobe is no longer asked for -show_programs.
     programs: list[dict[str, Any]] = Field(default_factory=list)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 from datetime import datetime
 from enum import Enum
 
@@ -17,6 +18,11 @@ class SourcePlatform(str, Enum):
     SORA = "sora"
     UNKNOWN = "unknown"
 
+    @functools.cached_property
+    def display_name(self) -> str:
+        """Capitalized name for display (computed once per member)."""
+        return self.value.capitalize()
+
 
 class SourceInfo(BaseModel):
     """Information about the video source.
@@ -6,15 +6,21 @@ from .container import (
     CONTAINER_BOXES,
     MP4_EXTENSIONS,
     extract_strings,
+    filter_interesting_lines,
     filter_interesting_strings,
+    iter_string_lines,
+    iter_strings,
     parse_mp4_boxes,
 )
+from .dates import parse_iso_datetime
 from .deps import (
     check_all_dependencies,
     check_python_dependencies,
     check_system_dependencies,
+    has_executable,
     print_dependency_status,
 )
+from .manifest import first_key, strip_binary_blobs
 from .url_parser import (
     ParsedURL,
     Platform,
@@ -31,12 +37,21 @@ __all__ = [
     "check_python_dependencies",
     "check_all_dependencies",
     "print_dependency_status",
+    "has_executable",
     # Container parsing
     "parse_mp4_boxes",
     "extract_strings",
+    "iter_strings",
+    "iter_string_lines",
     "filter_interesting_strings",
+    "filter_interesting_lines",
     "CONTAINER_BOXES",
     "MP4_EXTENSIONS",
+    # Date parsing
+    "parse_iso_datetime",
+    # Manifest helpers
+    "strip_binary_blobs",
+    "first_key",
     # URL parsing
     "Platform",
     "ParsedURL",
@@ -1,7 +1,13 @@
 """Container format parsing utilities."""
 
+import contextlib
+import mmap
+import os
+import re
 import struct
-from typing import BinaryIO
+import subprocess
+import threading
+from collections.abc import Generator, Iterable
 
 from aivid.models import BoxInfo
 
@@ -24,6 +30,59 @@ CONTAINER_BOXES = [
     "wave",
 ]
 
+# Boxes whose leading bytes are kept as a hex preview
+PREVIEW_BOXES = frozenset({"ftyp", "hdlr", "mvhd", "tkhd", "mdhd"})
+
+# Box header: 32-bit size and 4-character type, then an optional 64-bit size
+_BOX_HEADER = struct.Struct(">I4s")
+_BOX_LARGE_SIZE = struct.Struct(">Q")
+
+# Keywords that make an extracted string worth keeping
+INTERESTING_KEYWORDS = [
+    "copyright",
+    "author",
+    "creator",
+    "c2pa",
+    "contentauth",
+    "jumbf",
+    "xmp",
+    "sora",
+    "openai",
+    "google",
+    "adobe",
+    "gemini",
+    "veo",
+    "runway",
+    "pika",
+    "midjourney",
+    "stability",
+    "luma",
+    "kling",
+    "trained",
+    "generated",
+    "synthetic",
+    "ai-generated",
+    "ffmpeg",
+    "davinci",
+    "premiere",
+    "encoder",
+    "handler",
+    "software",
+    "manifest",
+    "signature",
+    "certificate",
+    "truepic",
+    "http://",
+    "https://",
+    "urn:",
+    "uuid:",
+]
+
+# One search per lowercased string instead of a substring test per keyword
+# (faster than re.IGNORECASE; the keywords are all lowercase)
+_INTERESTING_RE = re.compile("|".join(map(re.escape, INTERESTING_KEYWORDS)))
+_INTERESTING_BYTES_RE = re.compile(_INTERESTING_RE.pattern.encode())
+
 # MP4/MOV file extensions
 MP4_EXTENSIONS = [".mp4", ".m4v", ".m4a", ".mov", ".3gp", ".3g2"]
 
@@ -40,60 +99,65 @@ def parse_mp4_boxes(file_path: str, max_depth: int = 5) -> list[BoxInfo]:
     """
     boxes: list[BoxInfo] = []
 
-    def parse_boxes(f: BinaryIO, start: int, end: int, depth: int) -> None:
-        f.seek(start)
-        while f.tell() < end:
-            pos = f.tell()
-            header = f.read(8)
-            if len(header) < 8:
-                break
+    def parse_boxes(data: mmap.mmap, file_size: int) -> None:
+        # Walk the box tree depth-first with an explicit stack of
+        # (position, end, depth) cursors; when entering a container the rest
+        # of the current level is pushed and resumed after the children
+        stack = [(0, file_size, 0)]
+        while stack:
+            pos, end, depth = stack.pop()
+            while pos + 8 <= end:
+                size, box_type_bytes = _BOX_HEADER.unpack_from(data, pos)
+                try:
+                    box_type = box_type_bytes.decode("ascii")
+                except UnicodeDecodeError:
+                    box_type = box_type_bytes.decode("latin-1", errors="replace")
+                data_start = pos + 8
 
-            size, box_type_bytes = struct.unpack(">I4s", header)
-            try:
-                box_type = box_type_bytes.decode("ascii")
-            except UnicodeDecodeError:
-                box_type = box_type_bytes.decode("latin-1", errors="replace")
-
-            # Handle extended size
-            if size == 1:
-                ext_size = f.read(8)
-                if len(ext_size) == 8:
-                    size = struct.unpack(">Q", ext_size)[0]
-            elif size == 0:
-                size = end - pos
-
-            if size < 8 or pos + size > end:
-                break
+                # Handle extended size
+                if size == 1:
+                    if pos + 16 <= end:
+                        (size,) = _BOX_LARGE_SIZE.unpack_from(data, data_start)
+                        data_start += 8
+                elif size == 0:
+                    size = end - pos
 
-            box_info = BoxInfo(
-                type=box_type,
-                size=size,
-                offset=pos,
-                depth=depth,
-            )
+                if size < 8 or pos + size > end:
+                    break
 
-            # Read box data for certain types
-            if box_type in ["ftyp", "hdlr", "mvhd", "tkhd", "mdhd"]:
-                data_size = min(size - 8, 256)
-                box_info.data_preview = f.read(data_size).hex()[:100]
+                box_info = BoxInfo(
+                    type=box_type,
+                    size=size,
+                    offset=pos,
+                    depth=depth,
+                )
 
-            boxes.append(box_info)
+                # Read box data for certain types
+                if box_type in PREVIEW_BOXES:
+                    preview_end = min(data_start + min(size - 8, 256), end)
+                    box_info.data_preview = data[data_start:preview_end].hex()[:100]
 
-            # Recurse into container boxes
-            if box_type in CONTAINER_BOXES and depth < max_depth:
-                data_start = f.tell()
-                if box_type == "meta":
-                    f.read(4)  # skip version/flags
-                    data_start = f.tell()
-                parse_boxes(f, data_start, pos + size, depth + 1)
+                boxes.append(box_info)
 
-            f.seek(pos + size)
+                # Descend into container boxes
+                if box_type in CONTAINER_BOXES and depth < max_depth:
+                    if box_type == "meta":
+                        data_start += 4  # skip version/flags
+                    stack.append((pos + size, end, depth))
+                    pos, end, depth = data_start, pos + size, depth + 1
+                    continue
+
+                pos += size
 
     try:
         with open(file_path, "rb") as f:
-            f.seek(0, 2)
-            file_size = f.tell()
-            parse_boxes(f, 0, file_size, 0)
+            file_size = os.fstat(f.fileno()).st_size
+            if file_size == 0:
+                return boxes
+            # Map the file so box headers are read from the page cache without
+            # a read() call per box
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                parse_boxes(data, file_size)
     except Exception as e:
         boxes.append(BoxInfo(type="error", size=0, offset=0, depth=0, data_preview=str(e)))
 
@@ -110,8 +174,6 @@ def extract_strings(file_path: str, min_length: int = 4) -> list[str]:
     Returns:
         List of extracted strings
     """
-    import subprocess
-
     try:
         result = subprocess.run(
             ["strings", "-n", str(min_length), file_path],
@@ -126,61 +188,131 @@ def extract_strings(file_path: str, min_length: int = 4) -> list[str]:
     return []
 
 
-def filter_interesting_strings(strings: list[str]) -> list[str]:
+def iter_string_lines(
+    file_path: str, min_length: int = 4, timeout: float = 30
+) -> Generator[bytes, None, None]:
+    """Yield printable strings from a binary file as undecoded bytes.
+
+    The output of ``strings`` is read incrementally, so a caller that stops
+    early does not wait for (or hold) every string in a multi-GB file.
+    Closing the generator terminates the ``strings`` process.
+
+    Args:
+        file_path: Path to the file
+        min_length: Minimum string length to extract
+        timeout: Seconds after which the ``strings`` process is killed
+
+    Yields:
+        Extracted strings in file order, without the trailing newline
+
+    Raises:
+        subprocess.TimeoutExpired: After the last string, if ``strings`` was
+            killed because it ran past ``timeout``
+        subprocess.CalledProcessError: After the last string, if ``strings``
+            exited with an error. Callers should discard the strings yielded
+            so far, which may be incomplete.
+    """
+    cmd = ["strings", "-n", str(min_length), file_path]
+    try:
+        process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            close_fds=False,
+        )
+    except OSError:
+        return
+    assert process.stdout is not None
+    timed_out = threading.Event()
+
+    def kill() -> None:
+        timed_out.set()
+        process.kill()
+
+    timer = threading.Timer(timeout, kill)
+    timer.start()
+    try:
+        for line in process.stdout:
+            yield line.rstrip(b"\n")
+        returncode = process.wait()
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, cmd)
+    finally:
+        timer.cancel()
+        process.kill()
+        process.stdout.close()
+        process.wait()
+
+
+def iter_strings(
+    file_path: str, min_length: int = 4, timeout: float = 30
+) -> Generator[str, None, None]:
+    """Yield printable strings from a binary file as ``strings`` finds them.
+
+    Unlike ``extract_strings`` the output is read incrementally, so a caller
+    that stops early does not wait for (or hold) every string in a
+    multi-GB file. Closing the generator terminates the ``strings`` process.
+
+    Args:
+        file_path: Path to the file
+        min_length: Minimum string length to extract
+        timeout: Seconds after which the ``strings`` process is killed
+
+    Yields:
+        Extracted strings in file order
+
+    Raises:
+        subprocess.TimeoutExpired: If ``strings`` ran past ``timeout``
+        subprocess.CalledProcessError: If ``strings`` exited with an error
+    """
+    with contextlib.closing(iter_string_lines(file_path, min_length, timeout)) as lines:
+        for line in lines:
+            yield line.decode("utf-8", errors="replace")
+
+
+def filter_interesting_strings(strings: Iterable[str]) -> list[str]:
     """Filter strings for metadata-relevant content.
 
+    Stops consuming ``strings`` once 100 matches are found.
+
     Args:
-        strings: List of raw strings
+        strings: Raw strings, e.g. from ``extract_strings`` or ``iter_strings``
 
     Returns:
         List of potentially interesting strings
     """
-    # Keywords to look for
-    keywords = [
-        "copyright",
-        "author",
-        "creator",
-        "c2pa",
-        "contentauth",
-        "jumbf",
-        "xmp",
-        "sora",
-        "openai",
-        "google",
-        "adobe",
-        "gemini",
-        "veo",
-        "runway",
-        "pika",
-        "midjourney",
-        "stability",
-        "luma",
-        "kling",
-        "trained",
-        "generated",
-        "synthetic",
-        "ai-generated",
-        "ffmpeg",
-        "davinci",
-        "premiere",
-        "encoder",
-        "handler",
-        "software",
-        "manifest",
-        "signature",
-        "certificate",
-        "truepic",
-        "http://",
-        "https://",
-        "urn:",
-        "uuid:",
-    ]
-
     interesting = []
+    search = _INTERESTING_RE.search
     for s in strings:
-        s_lower = s.lower()
         # Skip very short or very long strings
-        if any(kw in s_lower for kw in keywords) and 4 <= len(s) <= 500:
+        if 4 <= len(s) <= 500 and search(s.lower()):
             interesting.append(s)
+            if len(interesting) == 100:  # Limit to first 100
+                break
+
+    return interesting
+
+
+def filter_interesting_lines(lines: Iterable[bytes]) -> list[str]:
+    """Filter undecoded strings for metadata-relevant content.
+
+    Same selection as ``filter_interesting_strings``, but only matching
+    lines are decoded, which skips decoding the bulk of a large file.
+
+    Args:
+        lines: Raw strings as bytes, e.g. from ``iter_string_lines``
+
+    Returns:
+        List of potentially interesting strings
+    """
+    interesting = []
+    search = _INTERESTING_BYTES_RE.search
+    for line in lines:
+        if 4 <= len(line) <= 500 and search(line.lower()):
+            interesting.append(line.decode("utf-8", errors="replace"))
+            if len(interesting) == 100:
+                break
 
-    return interesting[:100]  # Limit to first 100
+    return interesting
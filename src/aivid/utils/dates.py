@@ -0,0 +1,25 @@
+"""Date parsing utilities."""
+
+from datetime import datetime
+
+
+def parse_iso_datetime(value: object) -> datetime:
+    """Parse an ISO 8601 timestamp, accepting a trailing ``Z`` for UTC.
+
+    ``datetime.fromisoformat`` only understands the ``Z`` suffix from
+    Python 3.11, so it is rewritten to ``+00:00`` first. Strings are used
+    as-is; only non-string values go through ``str()``.
+
+    Args:
+        value: Timestamp value (usually a string from tool output)
+
+    Returns:
+        Parsed datetime
+
+    Raises:
+        ValueError: If the value is not a valid ISO 8601 timestamp
+    """
+    ts = value if isinstance(value, str) else str(value)
+    if ts.endswith("Z"):
+        ts = ts[:-1] + "+00:00"
+    return datetime.fromisoformat(ts)
@@ -1,8 +1,32 @@
 """Dependency checking utilities."""
 
+import functools
+import os
 import shutil
 
 
+@functools.cache
+def _find_executable(name: str, search_path: str | None) -> bool:
+    """Return whether an executable is found on the given search path."""
+    return shutil.which(name, path=search_path) is not None
+
+
+def has_executable(name: str) -> bool:
+    """Check whether an executable is on PATH, caching the result.
+
+    Extractors check their tools once per file; searching PATH each time
+    means a stat per directory. The result is cached per PATH value, like
+    the tool paths resolved by ``run_tool``, so the two agree if PATH changes.
+
+    Args:
+        name: Executable name (e.g., "ffprobe")
+
+    Returns:
+        True if the executable was found
+    """
+    return _find_executable(name, os.environ.get("PATH"))
+
+
 def check_system_dependencies() -> dict[str, bool]:
     """Check availability of system dependencies (binaries).
 
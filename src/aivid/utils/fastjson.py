@@ -0,0 +1,34 @@
+"""JSON decoding with an optional fast backend.
+
+Uses orjson when installed (``pip install aivid[speedups]``), which parses
+large tool outputs several times faster than the stdlib ``json`` module,
+and falls back to ``json`` otherwise.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one type covers both
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse a JSON document.
+
+    Args:
+        data: JSON text as bytes or str
+
+    Returns:
+        Parsed Python object
+
+    Raises:
+        JSONDecodeError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
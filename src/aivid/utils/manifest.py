@@ -0,0 +1,63 @@
+"""Helpers for working with parsed C2PA manifest data."""
+
+from typing import Any
+
+# Manifest keys that carry embedded binary payloads (base64 thumbnails etc.)
+BLOB_KEYS = frozenset({"thumbnail", "data", "image"})
+
+# Strings longer than this under a blob key are replaced with a placeholder
+BLOB_THRESHOLD = 4096
+
+ELIDED = "<elided>"
+
+# Substrings of an ingredient's MIME type/format that identify its media kind
+IMAGE_FORMAT_HINTS = ("image", "jpeg", "jpg", "png", "webp")
+VIDEO_FORMAT_HINTS = ("video", "mp4", "webm", "mov")
+
+
+def strip_binary_blobs(data: Any, threshold: int = BLOB_THRESHOLD) -> Any:
+    """Return a copy of manifest data with large embedded blobs elided.
+
+    Manifests often embed base64-encoded thumbnails that run to hundreds of
+    KB per file. Keeping them in ``VideoMetadata.raw`` multiplies memory use
+    when scanning many files, so they are replaced with ``"<elided>"``.
+
+    Args:
+        data: Parsed manifest data (dicts, lists and scalars).
+        threshold: Minimum string length for a blob field to be elided.
+
+    Returns:
+        The manifest data with oversized blob strings replaced.
+    """
+    if isinstance(data, dict):
+        return {
+            key: (
+                ELIDED
+                if key in BLOB_KEYS and isinstance(value, str) and len(value) > threshold
+                else strip_binary_blobs(value, threshold)
+            )
+            for key, value in data.items()
+        }
+    if isinstance(data, list):
+        return [strip_binary_blobs(item, threshold) for item in data]
+    return data
+
+
+def first_key(data: dict[str, Any], *keys: str) -> Any:
+    """Return the value of the first key present with a truthy value.
+
+    Manifest producers disagree on key spelling (``instanceId`` vs
+    ``instance_id``), so callers list the alternatives in preference order.
+
+    Args:
+        data: Manifest dict to look up.
+        *keys: Candidate keys, most preferred first.
+
+    Returns:
+        The first truthy value found, or None.
+    """
+    for key in keys:
+        value = data.get(key)
+        if value:
+            return value
+    return None
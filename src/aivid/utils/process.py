@@ -0,0 +1,46 @@
+"""Subprocess helpers for running external metadata tools."""
+
+import functools
+import os
+import shutil
+import subprocess
+
+
+@functools.cache
+def _resolve_executable(name: str, search_path: str | None) -> str:
+    """Return the full path of an executable, or ``name`` if it is not found."""
+    return shutil.which(name, path=search_path) or name
+
+
+def run_tool(
+    cmd: list[str], timeout: float, capture_stderr: bool = False
+) -> subprocess.CompletedProcess[bytes]:
+    """Run an external tool and capture its output as bytes.
+
+    The tool is resolved to its full path (cached per PATH value) and run with
+    ``close_fds=False``. File descriptors opened by Python are non-inheritable
+    by default, so this is safe; it skips walking the fd table in the child,
+    and together with the explicit path lets CPython start the tool with
+    ``posix_spawn`` instead of ``fork``, which matters once many tools run
+    per file.
+
+    Args:
+        cmd: Command and arguments
+        timeout: Timeout in seconds
+        capture_stderr: Capture stderr instead of discarding it
+
+    Returns:
+        Completed process with ``stdout`` (and ``stderr`` if captured) as bytes
+
+    Raises:
+        subprocess.TimeoutExpired: If the tool does not finish in time
+        FileNotFoundError: If the tool is not installed
+    """
+    executable = _resolve_executable(cmd[0], os.environ.get("PATH"))
+    return subprocess.run(
+        [executable, *cmd[1:]],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE if capture_stderr else subprocess.DEVNULL,
+        timeout=timeout,
+        close_fds=False,
+    )
@@ -23,7 +23,7 @@ class Platform(str, Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedURL:
     """Result of URL parsing."""
 
@@ -67,6 +67,20 @@ SORA_PATTERNS = [
     r"(?:https?://)?chatgpt\.com/g/([a-zA-Z0-9-]+)",
 ]
 
+# Compiled once at import, tried in list order
+_YOUTUBE_RES = tuple(re.compile(p) for p in YOUTUBE_PATTERNS)
+_TIKTOK_RES = tuple(re.compile(p) for p in TIKTOK_PATTERNS)
+_SORA_RES = tuple(re.compile(p) for p in SORA_PATTERNS)
+
+
+def _first_match(patterns: tuple[re.Pattern[str], ...], url: str) -> str | None:
+    """Return the first capture group of the first pattern found in ``url``."""
+    for pattern in patterns:
+        match = pattern.search(url)
+        if match:
+            return match.group(1)
+    return None
+
 
 def parse_youtube_url(url: str) -> str | None:
     """Extract video ID from YouTube URL.
@@ -77,11 +91,7 @@ def parse_youtube_url(url: str) -> str | None:
     Returns:
         11-character video ID or None
     """
-    for pattern in YOUTUBE_PATTERNS:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
-    return None
+    return _first_match(_YOUTUBE_RES, url)
 
 
 def parse_tiktok_url(url: str) -> str | None:
@@ -93,11 +103,7 @@ def parse_tiktok_url(url: str) -> str | None:
     Returns:
         Numeric video ID or short code (for vm.tiktok.com)
     """
-    for pattern in TIKTOK_PATTERNS:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
-    return None
+    return _first_match(_TIKTOK_RES, url)
 
 
 def parse_sora_url(url: str) -> str | None:
@@ -109,11 +115,7 @@ def parse_sora_url(url: str) -> str | None:
     Returns:
         Video/share ID or None
     """
-    for pattern in SORA_PATTERNS:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
-    return None
+    return _first_match(_SORA_RES, url)
 
 
 def detect_platform(url: str) -> Platform:
@@ -0,0 +1,68 @@
+"""Tests for the external tool output cache."""
+
+import os
+
+from aivid.extractors import cache as cache_module
+from aivid.extractors.cache import (
+    ToolCache,
+    cached_api_lookup,
+    cached_tool_output,
+    file_fingerprint,
+)
+
+
+class TestToolCache:
+    """Test ToolCache."""
+
+    def test_round_trip(self, tmp_path):
+        """Test stored values are returned for the same key and version only."""
+        cache = ToolCache("ffprobe", version="7.0", cache_dir=tmp_path)
+        assert cache.get("key") is None
+
+        cache.put("key", {"streams": [{"codec_type": "video"}]})
+        assert cache.get("key") == {"streams": [{"codec_type": "video"}]}
+        assert ToolCache("ffprobe", version="7.1", cache_dir=tmp_path).get("key") is None
+
+    def test_ttl_expiry(self, tmp_path):
+        """Test entries older than the TTL are treated as misses."""
+        cache = ToolCache("api", cache_dir=tmp_path, ttl=60)
+        cache.put("key", {"id": 1})
+        entry = next((tmp_path / "api").iterdir())
+        os.utime(entry, (0, 0))
+        assert cache.get("key") is None
+
+    def test_file_fingerprint_changes_with_content(self, tmp_path):
+        """Test the fingerprint changes when file content changes."""
+        video = tmp_path / "test.mp4"
+        video.write_bytes(b"\x00" * 200_000)
+        before = file_fingerprint(str(video))
+        video.write_bytes(b"\x00" * 199_999 + b"\x01")
+        assert file_fingerprint(str(video)) != before
+
+    def test_api_lookup_fetches_only_misses(self, tmp_path, monkeypatch):
+        """Test cached API results are reused and not-found results are retried."""
+        cache = ToolCache("youtube-api", cache_dir=tmp_path, ttl=60)
+        monkeypatch.setattr(cache_module, "get_api_cache", lambda platform: cache)
+        requested = []
+
+        def fetch(keys):
+            requested.append(keys)
+            return {key: ({"ai": True} if key == "a" else None) for key in keys}
+
+        assert cached_api_lookup("youtube", ["a", "b"], fetch) == {"a": {"ai": True}, "b": None}
+        assert cached_api_lookup("youtube", ["a", "b"], fetch) == {"a": {"ai": True}, "b": None}
+        assert requested == [["a", "b"], ["b"]]
+
+    def test_tool_output_misses_after_rename(self, tmp_path, monkeypatch):
+        """Test a renamed file is not served output that names its old path."""
+        cache = ToolCache("exiftool", cache_dir=tmp_path / "cache")
+        monkeypatch.setattr(cache_module, "get_tool_cache", lambda tool: cache)
+        video = tmp_path / "before.mp4"
+        video.write_bytes(b"\x00" * 100)
+
+        def run(path):
+            return {"SourceFile": path}
+
+        assert cached_tool_output("exiftool", str(video), run) == {"SourceFile": str(video)}
+        renamed = video.rename(tmp_path / "after.mp4")
+        assert cached_tool_output("exiftool", str(renamed), run) == {"SourceFile": str(renamed)}
@@ -0,0 +1,140 @@
+"""Tests for container parsing utilities."""
+
+import contextlib
+import shutil
+import struct
+import subprocess
+
+import pytest
+
+from aivid.utils import filter_interesting_lines, iter_string_lines, parse_mp4_boxes
+
+
+def box(box_type: bytes, payload: bytes = b"") -> bytes:
+    """Build an MP4 box with a 32-bit size header."""
+    return struct.pack(">I4s", 8 + len(payload), box_type) + payload
+
+
+def layout(path) -> list[tuple[str, int, int, int]]:
+    """Return (type, size, offset, depth) for each parsed box."""
+    return [(b.type, b.size, b.offset, b.depth) for b in parse_mp4_boxes(str(path))]
+
+
+class TestParseMP4Boxes:
+    """Test parse_mp4_boxes on hand-built files."""
+
+    def test_nested_containers(self, tmp_path):
+        """Test container children are listed depth-first before later siblings."""
+        video = tmp_path / "nested.mp4"
+        mvhd = box(b"mvhd", b"\x00" * 4)
+        trak = box(b"trak", box(b"tkhd", b"\x01\x02"))
+        video.write_bytes(box(b"ftyp", b"isom") + box(b"moov", mvhd + trak) + box(b"free"))
+
+        assert layout(video) == [
+            ("ftyp", 12, 0, 0),
+            ("moov", 38, 12, 0),
+            ("mvhd", 12, 20, 1),
+            ("trak", 18, 32, 1),
+            ("tkhd", 10, 40, 2),
+            ("free", 8, 50, 0),
+        ]
+        boxes = parse_mp4_boxes(str(video))
+        assert boxes[0].data_preview == b"isom".hex()
+        assert boxes[4].data_preview == "0102"
+
+    def test_meta_skips_version_and_flags(self, tmp_path):
+        """Test meta children start after the 4-byte version/flags field."""
+        video = tmp_path / "meta.mp4"
+        meta = box(b"meta", b"\x00\x00\x00\x00" + box(b"hdlr") + box(b"ilst"))
+        video.write_bytes(box(b"moov", box(b"udta", meta)))
+
+        assert layout(video) == [
+            ("moov", 44, 0, 0),
+            ("udta", 36, 8, 1),
+            ("meta", 28, 16, 2),
+            ("hdlr", 8, 28, 3),
+            ("ilst", 8, 36, 3),
+        ]
+
+    def test_extended_size(self, tmp_path):
+        """Test a size of 1 reads the 64-bit size after the box type."""
+        video = tmp_path / "large.mp4"
+        mdat = struct.pack(">I4sQ", 1, b"mdat", 20) + b"\x00" * 4
+        video.write_bytes(mdat + box(b"free"))
+
+        assert layout(video) == [("mdat", 20, 0, 0), ("free", 8, 20, 0)]
+
+    def test_size_zero_extends_to_end(self, tmp_path):
+        """Test a size of 0 means the box runs to the end of its parent."""
+        video = tmp_path / "open.mp4"
+        video.write_bytes(box(b"ftyp", b"isom") + struct.pack(">I4s", 0, b"mdat") + b"\x00" * 10)
+
+        assert layout(video) == [("ftyp", 12, 0, 0), ("mdat", 18, 12, 0)]
+
+    def test_truncated_box_stops_parsing(self, tmp_path):
+        """Test a box claiming more bytes than remain ends the walk at that level."""
+        video = tmp_path / "truncated.mp4"
+        video.write_bytes(box(b"ftyp", b"isom") + struct.pack(">I4s", 100, b"moov") + b"\x00" * 8)
+
+        assert layout(video) == [("ftyp", 12, 0, 0)]
+
+    def test_empty_file(self, tmp_path):
+        """Test an empty file has no boxes."""
+        video = tmp_path / "empty.mp4"
+        video.write_bytes(b"")
+
+        assert parse_mp4_boxes(str(video)) == []
+
+
+@pytest.mark.skipif(shutil.which("strings") is None, reason="strings not available")
+def test_iter_string_lines(tmp_path):
+    """Test printable runs are yielded as bytes without trailing newlines."""
+    video = tmp_path / "strings.mp4"
+    video.write_bytes(b"\x00\x01OpenAI Sora\x00ab\x00\xffhandler name\x00")
+
+    with contextlib.closing(iter_string_lines(str(video))) as lines:
+        assert list(lines) == [b"OpenAI Sora", b"handler name"]
+
+
+@pytest.mark.skipif(shutil.which("strings") is None, reason="strings not available")
+def test_iter_string_lines_raises_on_failure(tmp_path):
+    """Test a failed strings run raises instead of ending like a short file."""
+    with (
+        contextlib.closing(iter_string_lines(str(tmp_path / "missing.mp4"))) as lines,
+        pytest.raises(subprocess.CalledProcessError),
+    ):
+        list(lines)
+
+
+class DecodeCounter(bytes):
+    """Bytes that record each decode() call."""
+
+    decoded: list[bytes] = []
+
+    def decode(self, *args, **kwargs):
+        DecodeCounter.decoded.append(bytes(self))
+        return super().decode(*args, **kwargs)
+
+
+class TestFilterInterestingLines:
+    """Test filter_interesting_lines."""
+
+    def test_decodes_only_kept_lines(self):
+        """Test matching is case-insensitive and only matches are decoded."""
+        DecodeCounter.decoded = []
+        lines = [b"Made with OpenAI Sora", b"xyz", b"random bytes here", b"C2PA", b"ai"]
+
+        kept = filter_interesting_lines(DecodeCounter(line) for line in lines)
+
+        assert kept == ["Made with OpenAI Sora", "C2PA"]
+        assert DecodeCounter.decoded == [b"Made with OpenAI Sora", b"C2PA"]
+
+    def test_stops_after_100_matches(self):
+        """Test the scan keeps at most 100 strings and stops consuming input."""
+        lines = iter([f"encoder {i}".encode() for i in range(150)])
+
+        kept = filter_interesting_lines(lines)
+
+        assert len(kept) == 100
+        assert kept[-1] == "encoder 99"
+        assert next(lines) == b"encoder 100"
@@ -1,10 +1,21 @@
 """Tests for ExifTool extractor."""
 
+import functools
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from typing import ClassVar
 
 import pytest
 
-from aivid.extractors.exiftool import ExifToolExtractor
+from aivid import analyze as analyze_module
+from aivid import analyze_files
+from aivid import extractors as extractors_module
+from aivid.extractors import BaseExtractor
+from aivid.extractors import exiftool as exiftool_module
+from aivid.extractors.exiftool import ExifToolDaemon, ExifToolExtractor
 from aivid.models import FileInfo, VideoMetadata
 
 
@@ -227,6 +238,122 @@ class TestExifToolExtractor:
         assert metadata.descriptive.creation_timestamp.value.month == 1
 
 
+# Stand-in for exiftool: in -stay_open mode the file name picks the behaviour
+STUB_EXIFTOOL = """\
+import json, sys, time
+if "-stay_open" not in sys.argv:
+    print(json.dumps([{"SourceFile": sys.argv[-1], "Title": "oneshot"}]))
+    sys.exit()
+for line in sys.stdin:
+    path = line.strip()
+    if path == "-execute":
+        sys.stdout.write("{ready}\\n")
+    elif path == "False":
+        break
+    elif path.startswith("#"):
+        continue
+    elif "hang" in path:
+        time.sleep(60)
+    elif "die" in path:
+        sys.stdout.write('[{"SourceFile": ')
+        sys.exit(1)
+    elif "empty" not in path:
+        sys.stdout.write(json.dumps([{"SourceFile": path, "Title": "daemon"}]) + "\\n")
+    sys.stdout.flush()
+"""
+
+
+@pytest.fixture
+def stub_exiftool(tmp_path, monkeypatch):
+    """Put a stub exiftool script first on PATH."""
+    script = tmp_path / "exiftool"
+    script.write_text(f"#!{sys.executable}\n{STUB_EXIFTOOL}")
+    script.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{tmp_path}:{os.environ['PATH']}")
+    monkeypatch.setattr(exiftool_module, "has_executable", lambda name: True)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="stub exiftool is a POSIX script")
+@pytest.mark.usefixtures("stub_exiftool")
+class TestExifToolDaemon:
+    """Test ExifToolDaemon against a stub exiftool."""
+
+    def test_reads_metadata_per_file(self, tmp_path):
+        """Test each file's JSON is read up to the {ready} marker."""
+        first, second = str(tmp_path / "a.mp4"), str(tmp_path / "b.mp4")
+        with ExifToolDaemon() as daemon:
+            assert ExifToolDaemon.active() is daemon
+            assert daemon.get_metadata(first) == {"SourceFile": first, "Title": "daemon"}
+            assert daemon.get_metadata(second)["SourceFile"] == second
+        assert ExifToolDaemon.active() is None
+
+    def test_sends_absolute_paths(self, tmp_path, monkeypatch):
+        """Test a relative path starting with "#" is not read as an argfile comment."""
+        monkeypatch.chdir(tmp_path)
+        with ExifToolDaemon() as daemon:
+            data = daemon.get_metadata("#1 clip.mp4")
+        assert data["SourceFile"] == str(tmp_path / "#1 clip.mp4")
+
+    def test_empty_output(self):
+        """Test a file without metadata returns an empty dict."""
+        with ExifToolDaemon() as daemon:
+            assert daemon.get_metadata("empty.mp4") == {}
+            assert daemon.get_metadata("a.mp4")["Title"] == "daemon"
+
+    def test_died_mid_file_falls_back_to_one_shot(self):
+        """Test a daemon that exits mid-file stops and the extractor runs exiftool once."""
+        with ExifToolDaemon() as daemon:
+            with pytest.raises(OSError):
+                daemon.get_metadata("die.mp4")
+            with pytest.raises(OSError):
+                daemon.get_metadata("a.mp4")
+            assert ExifToolExtractor()._run_exiftool("a.mp4")["Title"] == "oneshot"
+
+    def test_timeout_kills_daemon(self):
+        """Test a hanging file is abandoned after the timeout."""
+        with ExifToolDaemon(timeout=0.5) as daemon:
+            with pytest.raises(OSError):
+                daemon.get_metadata("hang.mp4")
+            assert daemon._process is None
+
+    @pytest.mark.skipif(
+        "fork" not in multiprocessing.get_all_start_methods(), reason="needs the fork start method"
+    )
+    def test_forked_workers_start_their_own_daemon(self, tmp_path, monkeypatch):
+        """Test worker processes do not share the parent's exiftool pipes."""
+        monkeypatch.setattr(extractors_module, "_EXTRACTORS", [DaemonPidExtractor])
+        fork_pool = functools.partial(
+            ProcessPoolExecutor, mp_context=multiprocessing.get_context("fork")
+        )
+        monkeypatch.setattr(analyze_module, "ProcessPoolExecutor", fork_pool)
+        video = tmp_path / "a.mp4"
+        video.write_bytes(b"\x00" * 100)
+
+        with ExifToolDaemon() as daemon:
+            assert daemon._process is not None
+            parent_pid = str(daemon._process.pid)
+            results = analyze_files([str(video)], max_workers=1, use_processes=True)
+
+            assert results[0].descriptive.software not in (None, parent_pid)
+            assert daemon.get_metadata(str(video))["Title"] == "daemon"
+
+
+class DaemonPidExtractor(BaseExtractor):
+    """Records the process ID of the exiftool daemon active during extraction."""
+
+    name: ClassVar[str] = "daemon-pid"
+    priority: ClassVar[int] = 5
+
+    @classmethod
+    def is_available(cls) -> bool:
+        return True
+
+    def extract(self, path: str, metadata: VideoMetadata) -> None:
+        daemon = ExifToolDaemon.active()
+        if daemon is not None and daemon._process is not None:
+            metadata.descriptive.software = str(daemon._process.pid)
+
+
 class TestTimestampInfo:
     """Test TimestampInfo model."""
 
@@ -1,10 +1,28 @@
 """Tests for metadata extraction."""
 
+import functools
+import multiprocessing
+import os
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import ClassVar
+
 import pytest
 
-from aivid import __version__, analyze_file
-from aivid.models import FileInfo, VideoMetadata
-from aivid.utils import format_size
+from aivid import __version__, analyze_file, analyze_files
+from aivid import analyze as analyze_module
+from aivid import extractors as extractors_module
+from aivid.extractors import (
+    BaseExtractor,
+    FFprobeExtractor,
+    HeuristicDetector,
+    YouTubeAPIExtractor,
+)
+from aivid.extractors import ffprobe as ffprobe_module
+from aivid.formatters import format_json, format_json_list, format_quiet_list, write_quiet_list
+from aivid.models import AIDetectionResult, FileInfo, SourceInfo, SourcePlatform, VideoMetadata
+from aivid.utils import format_size, has_executable, parse_iso_datetime, strip_binary_blobs
 
 
 def test_version():
@@ -75,6 +93,75 @@ def test_video_metadata_c2pa():
     assert metadata.provenance.c2pa.is_ai_generated is True
 
 
+def test_ai_detection_from_c2pa_generator():
+    """Test the claim generator is matched like other generator names."""
+    result = AIDetectionResult.from_c2pa("Runway with Firefly", None, None)
+    assert result.generator == "Adobe Firefly"
+    assert result.is_ai_generated
+
+    assert AIDetectionResult.from_c2pa("Premiere Pro", None, None).generator is None
+
+
+def test_heuristic_signals_never_lower_confidence():
+    """Test heuristic signals raise the overall confidence but never lower it."""
+    file_info = FileInfo(
+        path="/test/video.mp4",
+        filename="video.mp4",
+        extension=".mp4",
+        size_bytes=1000,
+    )
+    metadata = VideoMetadata(file_info=file_info)
+    metadata.technical.video.handler = "Mainconcept Video Media Handler"
+    HeuristicDetector().extract(file_info.path, metadata)
+    assert metadata.ai_detection.confidence == 0.6
+
+    metadata = VideoMetadata(file_info=file_info)
+    metadata.ai_detection.confidence = 0.95
+    metadata.technical.audio.sample_rate = 96000
+    HeuristicDetector().extract(file_info.path, metadata)
+    assert metadata.ai_detection.signals["audio_96khz"].confidence == 0.9
+    assert metadata.ai_detection.confidence == 0.95
+
+
+def test_format_json_list_matches_format_json():
+    """Test JSON lists use the single-report encoding (null for NaN, compact separators)."""
+    file_info = FileInfo(
+        path="/test/video.mp4",
+        filename="video.mp4",
+        extension=".mp4",
+        size_bytes=1000,
+    )
+    metadata = VideoMetadata(file_info=file_info)
+    metadata.technical.duration = float("nan")
+
+    report = format_json(metadata, indent=None)
+    assert '"duration":null' in report
+    assert format_json_list([metadata], indent=None) == f"[{report}]"
+
+    indented = "\n".join("  " + line for line in format_json(metadata).splitlines())
+    assert format_json_list([metadata]) == f"[\n{indented}\n]"
+
+
+def test_write_quiet_list_matches_format_quiet_list():
+    """Test the streaming quiet list writes one newline-terminated line per file."""
+    metadata_list = [
+        VideoMetadata(
+            file_info=FileInfo(
+                path=f"/test/{name}", filename=name, extension=".mp4", size_bytes=1000
+            )
+        )
+        for name in ("a.mp4", "b.mp4")
+    ]
+    metadata_list[1].ai_detection.is_ai_generated = True
+
+    written = []
+    write_quiet_list(iter(metadata_list), written.append)
+
+    assert len(written) == 2
+    assert all(line.endswith("\n") for line in written)
+    assert "".join(written) == format_quiet_list(metadata_list) + "\n"
+
+
 def test_analyze_file_not_found():
     """Test analyze_file raises FileNotFoundError for missing files."""
     with pytest.raises(FileNotFoundError):
@@ -96,3 +183,168 @@ def test_analyze_file_basic(tmp_path, has_ffprobe):
     assert isinstance(metadata, VideoMetadata)
     assert metadata.filename == "test.mp4"
     assert metadata.file_info.extension == ".mp4"
+
+
+@pytest.mark.parametrize("use_processes", [False, True])
+def test_analyze_files_keeps_input_order(tmp_path, use_processes):
+    """Test batch analysis on threads and on worker processes."""
+    paths = []
+    for name in ("b.mp4", "a.mp4"):
+        video = tmp_path / name
+        video.write_bytes(b"\x00" * 100)
+        paths.append(str(video))
+
+    results = analyze_files(paths, max_workers=2, use_processes=use_processes)
+
+    assert [metadata.filename for metadata in results] == ["b.mp4", "a.mp4"]
+
+
+class StubAPIExtractor(BaseExtractor):
+    """Platform API stand-in that records whether a lookup came from the batch.
+
+    Batch results only count in the process that stored them, so worker
+    processes forked from the test behave as under spawn or forkserver.
+    """
+
+    name: ClassVar[str] = "stub-api"
+    priority: ClassVar[int] = 5
+
+    _batch: ClassVar[dict[str, str]] = {}
+    _batch_pid: ClassVar[int | None] = None
+
+    @classmethod
+    def is_available(cls) -> bool:
+        return True
+
+    @classmethod
+    def prefetch_batch(cls, paths: list[str]) -> None:
+        cls._batch.update(dict.fromkeys(map(os.path.basename, paths), "batch"))
+        cls._batch_pid = os.getpid()
+
+    @classmethod
+    def release_batch(cls) -> None:
+        cls._batch.clear()
+
+    @classmethod
+    def batch_state(cls) -> dict[str, str] | None:
+        return dict(cls._batch) or None
+
+    @classmethod
+    def restore_batch(cls, state: dict[str, str]) -> None:
+        cls._batch.update(state)
+        cls._batch_pid = os.getpid()
+
+    def extract(self, path: str, metadata: VideoMetadata) -> None:
+        batch = self._batch if self._batch_pid == os.getpid() else {}
+        metadata.descriptive.software = batch.get(metadata.filename, "api")
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(), reason="needs the fork start method"
+)
+def test_analyze_files_sends_batch_results_to_workers(tmp_path, monkeypatch):
+    """Test worker processes use the parent's batched API results."""
+    monkeypatch.setattr(extractors_module, "_EXTRACTORS", [StubAPIExtractor])
+    # Fork so the patched extractor list reaches the workers
+    fork_pool = functools.partial(
+        ProcessPoolExecutor, mp_context=multiprocessing.get_context("fork")
+    )
+    monkeypatch.setattr(analyze_module, "ProcessPoolExecutor", fork_pool)
+    paths = []
+    for name in ("a.mp4", "b.mp4"):
+        video = tmp_path / name
+        video.write_bytes(b"\x00" * 100)
+        paths.append(str(video))
+
+    results = analyze_files(paths, max_workers=2, use_processes=True)
+
+    assert [metadata.descriptive.software for metadata in results] == ["batch", "batch"]
+
+
+@pytest.mark.parametrize("max_workers", [0, -1])
+def test_analyze_files_rejects_invalid_max_workers(tmp_path, max_workers):
+    """Test max_workers below 1 is rejected instead of meaning the default."""
+    with pytest.raises(ValueError):
+        analyze_files([str(tmp_path / "a.mp4")], max_workers=max_workers)
+
+
+def test_api_prefetch_uses_source_video_id(monkeypatch):
+    """Test prefetch looks up the same video ID as extract, so only one request is made."""
+    requested = []
+
+    def fetch(video_ids):
+        requested.append(video_ids)
+        return dict.fromkeys(video_ids, {"containsSyntheticMedia": True})
+
+    monkeypatch.setattr(YouTubeAPIExtractor, "_fetch_statuses", staticmethod(fetch))
+    path = "/videos/title-dQw4w9WgXcQ.mp4"
+    metadata = VideoMetadata(
+        file_info=FileInfo(
+            path=path, filename="title-dQw4w9WgXcQ.mp4", extension=".mp4", size_bytes=1000
+        ),
+        source=SourceInfo(platform=SourcePlatform.YOUTUBE, video_id="abcdefghijk"),
+    )
+    extractor = YouTubeAPIExtractor()
+
+    extractor.prefetch(path, metadata)
+    extractor.extract(path, metadata)
+
+    assert requested == [["abcdefghijk"]]
+    assert metadata.provenance.platform_aigc.youtube_video_id == "abcdefghijk"
+
+
+def test_ffprobe_reads_chapters_without_full(monkeypatch):
+    """Test chapters are requested in default mode, since JSON export includes them."""
+    commands = []
+
+    def fake_run_tool(cmd, timeout, capture_stderr=False):
+        commands.append(cmd)
+        stdout = b'{"format": {}, "streams": [], "chapters": [{"id": 0}]}'
+        return subprocess.CompletedProcess(cmd, 0, stdout=stdout)
+
+    monkeypatch.setattr(ffprobe_module, "run_tool", fake_run_tool)
+    metadata = VideoMetadata(
+        file_info=FileInfo(path="/videos/a.mp4", filename="a.mp4", extension=".mp4", size_bytes=1)
+    )
+
+    FFprobeExtractor().extract("/videos/a.mp4", metadata)
+
+    assert "-show_chapters" in commands[0]
+    assert metadata.raw.chapters == [{"id": 0}]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="stub tool is a POSIX script")
+def test_has_executable_follows_path(tmp_path, monkeypatch):
+    """Test executable lookups are not reused after PATH changes."""
+    tool = tmp_path / "aivid-test-tool"
+    tool.write_text("#!/bin/sh\n")
+    tool.chmod(0o755)
+
+    monkeypatch.setenv("PATH", str(tmp_path / "empty"))
+    assert not has_executable(tool.name)
+    monkeypatch.setenv("PATH", str(tmp_path))
+    assert has_executable(tool.name)
+
+
+def test_parse_iso_datetime():
+    """Test ISO timestamp parsing with and without the UTC ``Z`` suffix."""
+    utc = parse_iso_datetime("2025-10-01T12:00:00Z")
+    assert utc.tzinfo is not None
+    assert utc.utcoffset().total_seconds() == 0
+    assert parse_iso_datetime("2025-10-01T12:00:00+08:00").hour == 12
+    with pytest.raises(ValueError):
+        parse_iso_datetime("not a date")
+
+
+def test_strip_binary_blobs():
+    """Test that large embedded blobs are elided from manifest data."""
+    blob = "A" * 5000
+    data = {
+        "title": "x" * 5000,
+        "ingredients": [{"title": "thumb.jpg", "thumbnail": blob, "data": "small"}],
+    }
+    stripped = strip_binary_blobs(data)
+    assert stripped["title"] == data["title"]
+    assert stripped["ingredients"][0]["thumbnail"] == "<elided>"
+    assert stripped["ingredients"][0]["data"] == "small"
+    assert data["ingredients"][0]["thumbnail"] == blob